@@ -1,4 +1,6 @@
+import argparse
 import os
+from pathlib import Path
 
 structure_file = "project_structure.txt"
 base_path = "."
@@ -39,52 +41,98 @@ def parse_line(line):
     depth = leading_spaces // 4
     return depth, name
 
-def create_structure_from_txt(file_path, base_path="."):
+def parse_structure(file_path):
+    """Read the whole tree file once into a list of (depth, name) entries."""
+    with open(file_path, "r") as f:
+        parsed = (parse_line(line) for line in f)
+        return [(depth, name) for depth, name in parsed if name is not None]
+
+def resolve_paths(entries, base_path=".", skip_top_level=False):
+    """Turn (depth, name) entries into (path, is_dir) pairs using a folder stack."""
     stack = [(base_path, -1)]
-    first_folder_skipped = False
-    skip_top_level = None
+    paths = []
+    for index, (depth, name) in enumerate(entries):
+        is_dir = name.endswith("/")
+        if index == 0 and is_dir and skip_top_level:
+            continue
 
-    with open(file_path, "r") as f:
-        for line in f:
-            depth, name = parse_line(line)
-            if name is None:
-                continue
-
-            # Prompt for top-level folder
-            if not first_folder_skipped:
-                first_folder_skipped = True
-                if name.endswith("/"):
-                    while skip_top_level is None:
-                        response = input(f"Do you want to skip creating the top-level folder '{name}'? [y/N]: ").lower()
-                        if response in ("y", "yes"):
-                            skip_top_level = True
-                        elif response in ("n", "no", ""):
-                            skip_top_level = False
-                    if skip_top_level:
-                        continue
-
-            current_path = os.path.join(stack[depth][0], name)
-
-            if name.endswith("/"):
-                if os.path.exists(current_path):
-                    if not prompt_overwrite(current_path, is_file=False):
-                        pass
-                else:
-                    os.makedirs(current_path)
-                # update stack
-                if len(stack) <= depth + 1:
-                    stack.append((current_path, depth))
-                else:
-                    stack[depth + 1] = (current_path, depth)
+        current_path = os.path.join(stack[depth][0], name)
+        paths.append((current_path, is_dir))
+        if is_dir:
+            # update stack
+            if len(stack) <= depth + 1:
+                stack.append((current_path, depth))
             else:
-                os.makedirs(os.path.dirname(current_path), exist_ok=True)
-                if os.path.exists(current_path):
-                    if prompt_overwrite(current_path, is_file=True):
-                        open(current_path, "w").close()
-                else:
-                    open(current_path, "a").close()
+                stack[depth + 1] = (current_path, depth)
+    return paths
+
+def create_structure_from_txt(file_path, base_path=".", mode="interactive", skip_top_level=None):
+    """Create the folders and files listed in a tree-like text file.
+
+    `mode` decides what happens to files that already exist: "force" truncates
+    them, "skip" leaves them alone and "interactive" asks once per file.
+    Existing folders are always kept. `skip_top_level` is only asked for
+    interactively when it is None and mode is "interactive".
+    """
+    entries = parse_structure(file_path)
+    if not entries:
+        return
+
+    top_is_dir = entries[0][1].endswith("/")
+    if skip_top_level is None:
+        skip_top_level = False
+        if top_is_dir and mode == "interactive":
+            while True:
+                response = input(f"Do you want to skip creating the top-level folder '{entries[0][1]}'? [y/N]: ").lower()
+                if response in ("y", "yes"):
+                    skip_top_level = True
+                    break
+                elif response in ("n", "no", ""):
+                    break
+
+    paths = resolve_paths(entries, base_path, skip_top_level)
+
+    # One makedirs per unique folder, covering both listed folders and file parents
+    folders = {path for path, is_dir in paths if is_dir}
+    folders.update(os.path.dirname(path) for path, is_dir in paths if not is_dir)
+    for folder in sorted(folders):
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+
+    for current_path, is_dir in paths:
+        if is_dir:
+            continue
+        if mode == "force":
+            open(current_path, "w").close()
+        elif mode == "skip":
+            # Exclusive create, so an existing file keeps its content and mtime
+            try:
+                Path(current_path).touch(exist_ok=False)
+            except FileExistsError:
+                pass
+        else:
+            # Create exclusively and only prompt when that says the file exists
+            try:
+                Path(current_path).touch(exist_ok=False)
+            except FileExistsError:
+                if prompt_overwrite(current_path, is_file=True):
+                    open(current_path, "w").close()
 
 if __name__ == "__main__":
-    create_structure_from_txt(structure_file, base_path)
-    print("Project structure created successfully.")
+    parser = argparse.ArgumentParser(description="Create a project skeleton from a tree-like text file.")
+    parser.add_argument("structure_file", nargs="?", default=structure_file)
+    parser.add_argument("--base-path", default=base_path)
+    existing = parser.add_mutually_exclusive_group()
+    existing.add_argument("--force", dest="mode", action="store_const", const="force",
+                          help="Truncate files that already exist.")
+    existing.add_argument("--skip", dest="mode", action="store_const", const="skip",
+                          help="Leave files that already exist untouched.")
+    existing.add_argument("--interactive", dest="mode", action="store_const", const="interactive",
+                          help="Ask before overwriting each existing file (default).")
+    parser.add_argument("--skip-top-level", action="store_true", default=None,
+                        help="Do not create the top-level folder of the tree.")
+    parser.set_defaults(mode="interactive")
+    args = parser.parse_args()
 
+    create_structure_from_txt(args.structure_file, args.base_path, args.mode, args.skip_top_level)
+    print("Project structure created successfully.")
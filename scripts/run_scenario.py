@@ -1,4 +1,5 @@
 import argparse
+import logging
 import yaml
 from pathlib import Path
 import sys
@@ -10,7 +11,8 @@ project_root = Path(__file__).resolve().parents[1]
 sys.path.append(str(project_root / "src"))
 
 #from pair_model.core.orchestrator import Orchestrator
-from kosmos_meteor.core.orchestrator import Orchestrator
+# Orchestrator is imported inside main(): it pulls in pandas, numba and the
+# models, so bad arguments or a broken config fail without that import cost.
 
 def main():
     """
@@ -39,8 +41,17 @@ def main():
         required=True,
         help="Path to save the output results CSV file."
     )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=None,
+        help="Stream results to the CSV this many cases at a time instead of holding them all in memory."
+    )
     args = parser.parse_args()
 
+    # The orchestrator reports its pipeline steps through logging
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     # --- 1. Load Scenario Configuration ---
     try:
         with open(args.config, 'r') as f:
@@ -58,34 +69,52 @@ def main():
         sys.exit(1)
 
     # --- 2. Run the Simulation ---
+    from kosmos_meteor.core.orchestrator import Orchestrator
+
     print("🚀 Initializing simulation...")
     start_time = time.time()
     
     orchestrator = Orchestrator(scenario_config)
-    results_df = orchestrator.run_simulation()
+    if args.chunk_size:
+        # Streaming writes the CSV itself and only returns per-column statistics
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        summary = orchestrator.run_simulation(output_path=args.output, chunk_size=args.chunk_size)
+    else:
+        results_df = orchestrator.run_simulation()
     
     end_time = time.time()
     duration = end_time - start_time
     print(f"\n✅ Simulation completed in {duration:.2f} seconds.")
 
     # --- 3. Save Results ---
-    try:
-        # Ensure the output directory exists
-        args.output.parent.mkdir(parents=True, exist_ok=True)
-        results_df.to_csv(args.output, index=False)
+    if args.chunk_size:
         print(f"💾 Results saved to: {args.output}")
-    except Exception as e:
-        print(f"❌ Error: Failed to save results to {args.output}. Reason: {e}")
-        sys.exit(1)
+    else:
+        try:
+            # Ensure the output directory exists
+            args.output.parent.mkdir(parents=True, exist_ok=True)
+            results_df.to_csv(args.output, index=False)
+            print(f"💾 Results saved to: {args.output}")
+        except Exception as e:
+            print(f"❌ Error: Failed to save results to {args.output}. Reason: {e}")
+            sys.exit(1)
 
     # --- 4. Print Summary ---
     print("\n--- 📊 Run Summary ---")
-    mean_diameter = results_df['diameter_m'].mean()
-    mean_energy = results_df['impact_energy_mt'].mean()
-    mean_affected_pop = results_df['max_affected_population'].mean()
-    max_affected_pop = results_df['max_affected_population'].max()
+    if args.chunk_size:
+        num_cases = int(summary.loc['diameter_m', 'count'])
+        mean_diameter = summary.loc['diameter_m', 'mean']
+        mean_energy = summary.loc['impact_energy_mt', 'mean']
+        mean_affected_pop = summary.loc['max_affected_population', 'mean']
+        max_affected_pop = summary.loc['max_affected_population', 'max']
+    else:
+        num_cases = len(results_df)
+        mean_diameter = results_df['diameter_m'].mean()
+        mean_energy = results_df['impact_energy_mt'].mean()
+        mean_affected_pop = results_df['max_affected_population'].mean()
+        max_affected_pop = results_df['max_affected_population'].max()
     
-    print(f"  Number of cases run: {len(results_df):,}")
+    print(f"  Number of cases run: {num_cases:,}")
     print(f"  Mean Asteroid Diameter: {mean_diameter:.2f} m")
     print(f"  Mean Impact Energy: {mean_energy:.2f} MT")
     print(f"  Mean Affected Population: {int(mean_affected_pop):,}")
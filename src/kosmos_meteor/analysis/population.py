@@ -1,6 +1,17 @@
 import numpy as np
+from numba import vectorize, float64
 
-def calculate_affected_population(damage_footprint: float, pop_density: float = 15.21) -> float:
+# Eagerly compiled ufunc, so one call handles a scalar or a whole column.
+# The guard is a single compare-and-select (NaN fails `> 0.0` too), which the
+# loop vectorizes without branching. fastmath is left off on purpose: it
+# would let LLVM assume NaN never reaches the compare.
+@vectorize([float64(float64, float64)], cache=True)
+def _affected_population(damage_footprint, pop_density):
+    # Assume the footprint is a radius in km for this example
+    area_km2 = np.pi * damage_footprint * damage_footprint
+    return area_km2 * pop_density if damage_footprint > 0.0 else 0.0
+
+def calculate_affected_population(damage_footprint, pop_density: float = 15.21):
     """Estimates the number of people affected within a damage footprint.
 
     This is a highly simplified function that assumes a circular damage area
@@ -9,17 +20,17 @@ def calculate_affected_population(damage_footprint: float, pop_density: float =
     perform a geospatial intersection.
 
     Args:
-        damage_footprint (float): The characteristic size of the damage area.
-            Can be a radius in km (for local damage) or another metric.
+        damage_footprint (float | array-like): The characteristic size of the
+            damage area, for one case or a whole column of cases. Can be a
+            radius in km (for local damage) or another metric.
         pop_density (float): The population density in people per square km.
             Defaults to the global average from the paper.
 
     Returns:
-        float: The estimated number of people affected.
+        float | np.ndarray: The estimated number of people affected, with the
+            same shape as `damage_footprint`.
     """
-    if damage_footprint <= 0 or np.isnan(damage_footprint):
-        return 0.0
-
-    # Assume the footprint is a radius in km for this example
-    area_km2 = np.pi * damage_footprint**2
-    return area_km2 * pop_density
\ No newline at end of file
+    # Compiled float compares flag NaN inputs as 'invalid'; the kernel's
+    # `damage_footprint > 0.0` select already maps them to 0
+    with np.errstate(invalid='ignore'):
+        return _affected_population(damage_footprint, pop_density)
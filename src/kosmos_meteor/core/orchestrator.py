@@ -1,3 +1,10 @@
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from itertools import repeat
+import logging
+import multiprocessing
+import numba
+import numpy as np
 import pandas as pd
 from tqdm import tqdm
 from pathlib import Path
@@ -10,6 +17,28 @@ from ..simulation.damage_models.global_effects import GlobalEffectsModel
 from ..analysis.population import calculate_affected_population
 from ..simulation.damage_models.vulnerability_models import VulnerabilityCalculator
 
+logger = logging.getLogger(__name__)
+
+def _accumulate_summary(summary, chunk_df: pd.DataFrame) -> pd.DataFrame:
+    """Folds one chunk's count, sum and max per numeric column into `summary`."""
+    numeric = chunk_df.select_dtypes('number')
+    chunk_summary = pd.DataFrame({'count': numeric.count(), 'sum': numeric.sum(), 'max': numeric.max()})
+    if summary is None:
+        return chunk_summary
+    return pd.DataFrame({
+        'count': summary['count'] + chunk_summary['count'],
+        'sum': summary['sum'] + chunk_summary['sum'],
+        'max': np.fmax(summary['max'], chunk_summary['max']),
+    })
+
+def _init_chunk_worker():
+    # One Numba thread per process, the pool already occupies every core
+    numba.set_num_threads(1)
+
+def _simulate_chunk(config: dict, num_cases: int, h_magnitude: float, chunk_seed) -> pd.DataFrame:
+    """Process-pool entry point: simulates one independently seeded chunk."""
+    return Orchestrator(config)._simulate_seeded_chunk(num_cases, h_magnitude, chunk_seed)
+
 class Orchestrator:
     """Manages the end-to-end execution of a PAIR simulation scenario.
 
@@ -35,73 +64,155 @@ class Orchestrator:
         self.global_effects_model = GlobalEffectsModel()
         self.vulnerability = VulnerabilityCalculator()
 
-    def run_simulation(self) -> pd.DataFrame:
+    def run_simulation(self, output_path=None, chunk_size: int = 10_000, max_workers: int = None) -> pd.DataFrame:
         """Executes the full simulation pipeline.
 
         The pipeline consists of:
         1. Generating Monte Carlo cases.
-        2. Iterating through each case to simulate entry and damage.
+        2. Running each model once on the full batch of cases to simulate
+           entry and damage.
         3. Calculating the affected population for each case.
         4. Aggregating and returning the results.
 
+        Args:
+            output_path (str | Path, optional): If given, cases are generated,
+                simulated and appended to this CSV `chunk_size` rows at a time,
+                so memory stays flat however many cases are run. Each chunk
+                draws from its own child of the configured seed.
+            chunk_size (int): Rows per chunk when streaming to `output_path`.
+            max_workers (int, optional): Worker processes simulating chunks
+                in parallel while streaming; one per CPU if None. 1 runs the
+                chunks in this process.
+
         Returns:
             pd.DataFrame: A DataFrame containing the results for every
                 simulated case, including inputs and all calculated outputs.
+                When streaming, a summary with the count, mean and max of
+                every numeric column instead.
         """
-        print("Step 1: Generating impact cases...")
+        num_cases = self.config.get("num_cases", 1000)
+        h_magnitude = self.config.get("h_magnitude", 22.0) # absolute magnitude (H) of the asteroid
+        if output_path is not None:
+            return self._run_chunked(output_path, num_cases, h_magnitude, chunk_size, max_workers)
+
+        # One Generator drives the case sampling and the damage models' own
+        # draws, so the configured seed reproduces the whole run
+        rng = np.random.default_rng(self.config.get("seed"))
+
+        logger.info("Step 1: Generating impact cases...")
         impact_cases = generate_cases(
-            num_cases=self.config.get("num_cases", 1000),
-            h_magnitude=self.config.get("h_magnitude", 22.0) # absolute magnitude (H) of the asteroid
+            num_cases=num_cases,
+            h_magnitude=h_magnitude,
+            seed=rng,
+            forced_properties=self.config.get("forced_properties"),
         )
-        print(f"Generated {len(impact_cases)} cases.")
-
-        results = []
-        print("\nStep 2: Running simulation for each case...")
-        for _, case in tqdm(impact_cases.iterrows(), total=len(impact_cases)):
-            # Simulate atmospheric entry
-            entry_result = self.fcm.run_entry(case)
-
-            # Simulate damage mechanisms
-            local_damage = self.local_damage_model.calculate_damage(case, entry_result)
-            tsunami_damage = self.tsunami_model.calculate_damage(case, entry_result)
-            global_effects = self.global_effects_model.calculate_damage(case, entry_result)
-            # Simulate Severity + Vulnerability (by 7 effects + combined)
-            vulnerability = self.vulnerability.calculate_all_vulnerabilities(case,entry_result)
-
-
-            # Consolidate results for this case
-            case_result = {
-                **case.to_dict(),
-                **entry_result,
-                **local_damage,
-                **tsunami_damage,
-                **global_effects,
-                **vulnerability,
-            }
-
-            # Step 3: Calculate affected population
-            # This is a simplified placeholder. A real implementation would need
-            # gridded population data and geospatial intersection logic.
-            case_result['affected_population_local'] = calculate_affected_population(
-                damage_footprint=case_result['blast_radius_1psi_km']
-            )
-            case_result['affected_population_tsunami'] = calculate_affected_population(
-                damage_footprint=case_result['tsunami_runup_m']
-            )
-            case_result['affected_population_global'] = (
-                case_result['global_effects_fraction'] * 7.8e9  # Approx world pop
-            )
-
-            # Determine the single largest hazard
-            case_result['max_affected_population'] = max(
-                case_result['affected_population_local'],
-                case_result['affected_population_tsunami'],
-                case_result['affected_population_global']
-            )
-            results.append(case_result)
-
-        print("\nStep 4: Aggregating results.")
-        results_df = pd.DataFrame(results)
+        logger.info("Generated %s cases.", len(impact_cases))
+
+        logger.info("Step 2: Running batched simulation over all cases...")
+        results_df = self._simulate_batch(impact_cases, rng=rng)
+
+        logger.info("Step 4: Aggregating results.")
+        return results_df
+
+    def _run_chunked(self, output_path, num_cases: int, h_magnitude: float, chunk_size: int, max_workers: int) -> pd.DataFrame:
+        """Streams the pipeline to `output_path` chunk by chunk and returns the summary."""
+        if num_cases <= 0:
+            raise ValueError(f"num_cases must be positive to stream results, got {num_cases}")
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        n_chunks = -(-num_cases // chunk_size)
+        chunk_seeds = np.random.SeedSequence(self.config.get("seed")).spawn(n_chunks)
+        chunk_sizes = [min(chunk_size, num_cases - k * chunk_size) for k in range(n_chunks)]
+
+        # Chunks are independent, so workers simulate them while this process
+        # writes them out in order. Workers are spawned, not forked: this
+        # process has already started the threading layer of the parallel
+        # kernels, and TBB or OpenMP can't survive a fork
+        parallel = n_chunks > 1 and max_workers != 1
+        pool = ProcessPoolExecutor(
+            max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_chunk_worker,
+        ) if parallel else nullcontext()
+
+        logger.info("Streaming %s cases to %s in %s chunks...", num_cases, output_path, n_chunks)
+        summary = None
+        with pool:
+            if parallel:
+                chunk_dfs = pool.map(_simulate_chunk, repeat(self.config), chunk_sizes, repeat(h_magnitude), chunk_seeds)
+            else:
+                chunk_dfs = map(self._simulate_seeded_chunk, chunk_sizes, repeat(h_magnitude), chunk_seeds)
+            for k, chunk_df in enumerate(tqdm(chunk_dfs, total=n_chunks)):
+                chunk_df.to_csv(output_path, mode='w' if k == 0 else 'a', header=k == 0, index=False)
+                summary = _accumulate_summary(summary, chunk_df)
+
+        logger.info("Step 4: Aggregating results.")
+        return pd.DataFrame({
+            'count': summary['count'],
+            'mean': summary['sum'] / summary['count'],
+            'max': summary['max'],
+        })
+
+    def _simulate_seeded_chunk(self, num_cases: int, h_magnitude: float, chunk_seed) -> pd.DataFrame:
+        """Generates and simulates one chunk, drawing everything from `chunk_seed`."""
+        rng = np.random.default_rng(chunk_seed)
+        impact_cases = generate_cases(
+            num_cases=num_cases,
+            h_magnitude=h_magnitude,
+            seed=rng,
+            forced_properties=self.config.get("forced_properties"),
+        )
+        return self._simulate_batch(impact_cases, rng=rng)
+
+    def _simulate_batch(self, impact_cases: pd.DataFrame, rng=None) -> pd.DataFrame:
+        """Runs every model and the population estimate on a batch of cases."""
+        # Simulate atmospheric entry
+        entry_results = self.fcm.run_batch(impact_cases)
+
+        # Simulate damage mechanisms
+        local_damage = self.local_damage_model.run_batch(impact_cases, entry_results)
+        tsunami_damage = self.tsunami_model.run_batch(impact_cases, entry_results)
+        global_effects = self.global_effects_model.run_batch(impact_cases, entry_results)
+        # Simulate Severity + Vulnerability (by 7 effects + combined)
+        vulnerability = self.vulnerability.run_batch(impact_cases, entry_results, rng=rng)
+
+        # Consolidate results: every model output shares the cases index, so
+        # this is one columnar concat
+        results_df = pd.concat(
+            [impact_cases, entry_results, local_damage, tsunami_damage, global_effects, vulnerability],
+            axis=1,
+        )
+        if results_df.columns.has_duplicates:
+            duplicated = results_df.columns[results_df.columns.duplicated()].tolist()
+            raise ValueError(f"Model outputs overwrite each other's columns: {duplicated}")
+
+        # Step 3: Calculate affected population
+        return self._add_affected_population(results_df)
+
+    @staticmethod
+    def _add_affected_population(results_df: pd.DataFrame) -> pd.DataFrame:
+        """Adds the affected-population columns to a consolidated results frame."""
+        # This is a simplified placeholder. A real implementation would need
+        # gridded population data and geospatial intersection logic.
+        results_df['affected_population_local'] = calculate_affected_population(
+            damage_footprint=results_df['blast_radius_1psi_km']
+        )
+        results_df['affected_population_tsunami'] = calculate_affected_population(
+            damage_footprint=results_df['tsunami_runup_m']
+        )
+        results_df['affected_population_global'] = (
+            results_df['global_effects_fraction'] * 7.8e9  # Approx world pop
+        )
+
+        # Determine the single largest hazard
+        results_df['max_affected_population'] = np.maximum(
+            np.maximum(
+                results_df['affected_population_local'].to_numpy(),
+                results_df['affected_population_tsunami'].to_numpy(),
+            ),
+            results_df['affected_population_global'].to_numpy(),
+        )
+
         return results_df
     
     def run_case(self, df_case_adhoc : pd.DataFrame) -> pd.DataFrame:
@@ -109,7 +220,8 @@ class Orchestrator:
 
         The pipeline consists of:
         1. Generating Monte Carlo cases.
-        2. Iterating through each case to simulate entry and damage.
+        2. Running each model once on the whole batch of cases to simulate
+           entry, damage and vulnerability.
         3. Calculating the affected population for each case.
         4. Aggregating and returning the results.
 
@@ -122,60 +234,21 @@ class Orchestrator:
         #     num_cases=self.config.get("num_cases", 1000),
         #     h_magnitude=self.config.get("h_magnitude", 22.0) # absolute magnitude (H) of the asteroid
         # )
-        print("Step 1: Receive impact cases...")
+        logger.info("Step 1: Receive impact cases...")
         impact_cases = pd.DataFrame(df_case_adhoc)
-        print(f"Received {len(impact_cases)} cases.")
-
-        results = []
-        print("\nStep 2: Running simulation for each case...")
-        for _, case in tqdm(impact_cases.iterrows(), total=len(impact_cases)):
-            # Simulate atmospheric entry
-            entry_result = self.fcm.run_entry(case)
-
-            # Simulate damage mechanisms
-            local_damage = self.local_damage_model.calculate_damage(case, entry_result)
-            tsunami_damage = self.tsunami_model.calculate_damage(case, entry_result)
-            global_effects = self.global_effects_model.calculate_damage(case, entry_result)
-            # Simulate Severity + Vulnerability (by 7 effects + combined)
-            vulnerability = self.vulnerability.calculate_all_vulnerabilities(case,entry_result)
-            
-
-            # Consolidate results for this case
-            case_result = {
-                **case.to_dict(),
-                **entry_result,
-                **local_damage,
-                **tsunami_damage,
-                **global_effects,
-                **vulnerability,
-            }
-
-            # Step 3: Calculate affected population
-            # This is a simplified placeholder. A real implementation would need
-            # gridded population data and geospatial intersection logic.
-            case_result['affected_population_local'] = calculate_affected_population(
-                damage_footprint=case_result['blast_radius_1psi_km']
-            )
-            case_result['affected_population_tsunami'] = calculate_affected_population(
-                damage_footprint=case_result['tsunami_runup_m']
-            )
-            case_result['affected_population_global'] = (
-                case_result['global_effects_fraction'] * 7.8e9  # Approx world pop
-            )
-
-            # Determine the single largest hazard
-            case_result['max_affected_population'] = max(
-                case_result['affected_population_local'],
-                case_result['affected_population_tsunami'],
-                case_result['affected_population_global']
-            )
-            results.append(case_result)
-
-        print("\nStep 4: Aggregating results.")
-        results_df = pd.DataFrame(results)
-
-        print("\nStep 5: Simulate Severity + Vulnerability (by 7 effects + combined) for each distance.")
+        logger.info("Received %s cases.", len(impact_cases))
+
+        logger.info("Step 2: Running batched simulation over all cases...")
+        # Same single pass as `run_simulation`; without an rng the
+        # vulnerability draws come from NumPy's global state in the same
+        # order as a per-case loop would
+        results_df = self._simulate_batch(impact_cases)
+        logger.info("Step 4: Aggregating results.")
+
+        logger.info("Step 5: Simulate Severity + Vulnerability (by 7 effects + combined) for each distance.")
         # Simulate Severity + Vulnerability (by 7 effects + combined) for each distance
+        last_case = impact_cases.iloc[-1:]
+        case, entry_result = last_case.iloc[0].to_dict(), self.fcm.run_batch(last_case).iloc[0].to_dict()
         df_vulnerability_by_distance = self.vulnerability.loopdistance_calculate_all_vulnerabilities_dictlist2df(case,entry_result)
         # case_result_vuln = {**vulnerability_by_distance}
 
@@ -2,12 +2,31 @@
 import httpx
 import os
 import asyncio
+import requests
 
 API_KEY = os.getenv("NASA_API_KEY", "H3OI1f68f29fVku1weRGDDyzi74ialdBE9PDe70L")
+NEO_URL = "https://api.nasa.gov/neo/rest/v1/neo/{neo_id}?api_key={api_key}"
 
-async def fetch_neo(neo_id: str) -> dict:
-    url = f"https://api.nasa.gov/neo/rest/v1/neo/{neo_id}?api_key={API_KEY}"
-    async with httpx.AsyncClient(timeout=10) as client:
-        resp = await client.get(url)
-        resp.raise_for_status()
-        return resp.json()
+async def fetch_neo(neo_id: str, client: httpx.AsyncClient | None = None) -> dict:
+    # Reuse the caller's client (and its connection pool) when one is given
+    if client is None:
+        async with httpx.AsyncClient(timeout=10) as client:
+            return await fetch_neo(neo_id, client)
+    resp = await client.get(NEO_URL.format(neo_id=neo_id, api_key=API_KEY))
+    resp.raise_for_status()
+    return resp.json()
+
+def fetch_neo_sync(neo_id: str, session: requests.Session | None = None) -> dict:
+    # Blocking counterpart of `fetch_neo` for callers without an event loop;
+    # reusing `session` keeps the connection alive between calls
+    get = requests.get if session is None else session.get
+    resp = get(NEO_URL.format(neo_id=neo_id, api_key=API_KEY), timeout=10)
+    resp.raise_for_status()
+    return resp.json()
+
+async def fetch_neos(neo_ids: list[str], client: httpx.AsyncClient | None = None) -> list[dict]:
+    # All requests run concurrently over a single client, so TLS setup is paid once
+    if client is None:
+        async with httpx.AsyncClient(timeout=10) as client:
+            return await fetch_neos(neo_ids, client)
+    return await asyncio.gather(*(fetch_neo(neo_id, client) for neo_id in neo_ids))
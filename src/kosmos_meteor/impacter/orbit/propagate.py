@@ -1,16 +1,169 @@
-"""Keplerian propagation using poliastro."""
-from poliastro.bodies import Sun
-from poliastro.twobody.orbit import Orbit
-from astropy import units as u
-
-def propagate(elements: dict, days: float):
-    orb = Orbit.from_classical(
-        attractor=Sun,
-        a=float(elements["semi_major_axis"]) * u.AU,
-        ecc=float(elements["eccentricity"]) * u.one,
-        inc=float(elements["inclination"]) * u.deg,
-        raan=float(elements["ascending_node_longitude"]) * u.deg, #
-        argp=float(elements["perihelion_argument"]) * u.deg,
-        nu=float(elements["mean_anomaly"]) * u.deg, # need keplerian true anomaly (not mean anomaly)
-    )
-    return orb.propagate(days * u.day)
+"""Keplerian propagation – two-body Kepler equation solver, no astropy units."""
+import math
+from dataclasses import dataclass
+import numpy as np
+from numba import njit, prange
+
+GM_SUN = 1.32712440018e11  # km^3 / s^2
+AU_KM = 1.495978707e8
+DAY_S = 86400.0
+
+# Column order of the elements array taken by `propagate_batch`
+ELEMENT_KEYS = (
+    "semi_major_axis",           # AU
+    "eccentricity",
+    "inclination",               # deg
+    "ascending_node_longitude",  # deg
+    "perihelion_argument",       # deg
+    "mean_anomaly",              # deg, at epoch
+)
+
+@dataclass
+class OrbitState:
+    """Heliocentric state: `r` in km and `v` in km/s, shape (3,) or (3, N)."""
+    r: np.ndarray
+    v: np.ndarray
+
+# Explicit signatures compile eagerly at import (or load from the on-disk
+# cache), so the first call from the web app carries no JIT latency
+@njit("float64(float64, float64)", cache=True)
+def kepler_solve(M, e):
+    """Eccentric anomaly E for mean anomaly M (rad), elliptic orbits only.
+
+    Laguerre-Conway iteration: converges from any starting point for every
+    e < 1, typically in 3-4 steps, so no eccentricity-dependent start or
+    regime branches are needed.
+    """
+    E = M + 0.85 * e * (1.0 if math.sin(M) >= 0.0 else -1.0)
+    for _ in range(30):
+        s_e, c_e = e * math.sin(E), e * math.cos(E)
+        f = E - s_e - M
+        df = 1.0 - c_e
+        dE = 5.0 * f / (df + math.copysign(math.sqrt(abs(16.0 * df * df - 20.0 * f * s_e)), df))
+        E -= dE
+        if abs(dE) < 1e-12:
+            break
+    return E
+
+@njit("UniTuple(float64, 6)(float64, float64, float64)", cache=True)
+def _orientation(inc, raan, argp):
+    """P and Q columns of the perifocal -> inertial rotation (angles in rad)."""
+    c_O, s_O = math.cos(raan), math.sin(raan)
+    c_i, s_i = math.cos(inc), math.sin(inc)
+    c_w, s_w = math.cos(argp), math.sin(argp)
+    return (c_O * c_w - s_O * s_w * c_i, s_O * c_w + c_O * s_w * c_i, s_w * s_i,
+            -c_O * s_w - s_O * c_w * c_i, -s_O * s_w + c_O * c_w * c_i, c_w * s_i)
+
+@njit("UniTuple(float64, 4)(float64, float64, float64, float64)", cache=True)
+def _perifocal_state(a, ecc, M0, dt_s):
+    """In-plane position (km) and velocity (km/s) `dt_s` seconds after epoch."""
+    n = math.sqrt(GM_SUN / a ** 3)
+    p = a * (1.0 - ecc * ecc)
+    h = math.sqrt(GM_SUN * p)
+
+    M = (M0 + n * dt_s + math.pi) % (2.0 * math.pi) - math.pi
+    E = kepler_solve(M, ecc)
+    nu = 2.0 * math.atan2(math.sqrt(1.0 + ecc) * math.sin(0.5 * E),
+                          math.sqrt(1.0 - ecc) * math.cos(0.5 * E))
+    r = p / (1.0 + ecc * math.cos(nu))
+    return (r * math.cos(nu), r * math.sin(nu),
+            -GM_SUN / h * math.sin(nu), GM_SUN / h * (ecc + math.cos(nu)))
+
+# Compiled without fastmath, so a NaN eccentricity fails the check too
+@njit("boolean(float64)", cache=True)
+def _is_elliptic(ecc):
+    return 0.0 <= ecc < 1.0
+
+@njit("float64[:, :](float64[:, :], float64[:])", parallel=True, fastmath=True, cache=True)
+def propagate_batch(elements, days):
+    """Propagates N orbits at once.
+
+    Args:
+        elements (np.ndarray): (N, 6) array of classical elements, columns as
+            in `ELEMENT_KEYS` (AU and degrees, as the NEO API reports them).
+        days (np.ndarray): (N,) time offsets from epoch, in days.
+
+    Returns:
+        np.ndarray: (N, 6) heliocentric states (x, y, z in km, vx, vy, vz in km/s).
+
+    Raises ValueError if any row's eccentricity is outside [0, 1), like
+    `propagate`, rather than filling that row with NaN.
+    """
+    for k in range(elements.shape[0]):
+        if not _is_elliptic(elements[k, 1]):
+            raise ValueError("propagate_batch handles elliptic orbits only (0 <= e < 1)")
+    out = np.empty((elements.shape[0], 6))
+    for k in prange(elements.shape[0]):
+        rot = _orientation(math.radians(elements[k, 2]), math.radians(elements[k, 3]),
+                           math.radians(elements[k, 4]))
+        x, y, vx, vy = _perifocal_state(elements[k, 0] * AU_KM, elements[k, 1],
+                                        math.radians(elements[k, 5]), days[k] * DAY_S)
+        for j in range(3):
+            out[k, j] = rot[j] * x + rot[3 + j] * y
+            out[k, 3 + j] = rot[j] * vx + rot[3 + j] * vy
+    return out
+
+@njit("float64[:, :](float64[:], float64[:])", parallel=True, fastmath=True, cache=True)
+def propagate_orbit(elements, days):
+    """Propagates one orbit to N times; the rotation is built once, not per time.
+
+    Args:
+        elements (np.ndarray): (6,) classical elements, ordered as `ELEMENT_KEYS`.
+        days (np.ndarray): (N,) time offsets from epoch, in days.
+
+    Returns:
+        np.ndarray: (N, 6) heliocentric states, as in `propagate_batch`.
+
+    Raises ValueError for an eccentricity outside [0, 1).
+    """
+    if not _is_elliptic(elements[1]):
+        raise ValueError("propagate_orbit handles elliptic orbits only (0 <= e < 1)")
+    rot = _orientation(math.radians(elements[2]), math.radians(elements[3]), math.radians(elements[4]))
+    a, ecc, M0 = elements[0] * AU_KM, elements[1], math.radians(elements[5])
+    out = np.empty((days.shape[0], 6))
+    for k in prange(days.shape[0]):
+        x, y, vx, vy = _perifocal_state(a, ecc, M0, days[k] * DAY_S)
+        for j in range(3):
+            out[k, j] = rot[j] * x + rot[3 + j] * y
+            out[k, 3 + j] = rot[j] * vx + rot[3 + j] * vy
+    return out
+
+def elements_array(elements: dict) -> np.ndarray:
+    """NEO API elements dict -> (6,) row in `ELEMENT_KEYS` order."""
+    return np.array([float(elements[key]) for key in ELEMENT_KEYS])
+
+def elements_from_state(r, v) -> np.ndarray:
+    """Heliocentric state (km, km/s) -> (6,) elliptic elements row for `propagate_batch`."""
+    r, v = np.asarray(r, dtype=np.float64), np.asarray(v, dtype=np.float64)
+    r_norm = np.linalg.norm(r)
+    h = np.cross(r, v)
+    h_hat = h / np.linalg.norm(h)
+    e_vec = ((v @ v - GM_SUN / r_norm) * r - (r @ v) * v) / GM_SUN
+    ecc = np.linalg.norm(e_vec)
+    if ecc >= 1.0:
+        raise ValueError(f"State is not on an elliptic orbit (eccentricity {ecc:.6f})")
+    a = 1.0 / (2.0 / r_norm - v @ v / GM_SUN)
+
+    # Node line; an equatorial orbit has none, so measure from +x instead
+    node = np.array([-h[1], h[0], 0.0])
+    node = node / np.linalg.norm(node) if np.linalg.norm(node) > 1e-12 else np.array([1.0, 0.0, 0.0])
+    inc = math.acos(h_hat[2])
+    raan = math.atan2(node[1], node[0])
+    # Angles measured around the orbit normal: node -> perihelion -> body
+    argp = math.atan2(np.cross(node, e_vec) @ h_hat, node @ e_vec)
+    nu = math.atan2(np.cross(e_vec, r) @ h_hat, e_vec @ r)
+
+    E = math.atan2(math.sqrt(1.0 - ecc * ecc) * math.sin(nu), ecc + math.cos(nu))
+    M = E - ecc * math.sin(E)
+    return np.array([a / AU_KM, ecc, *np.degrees([inc, raan, argp, M])])
+
+def propagate(elements: dict, days) -> OrbitState:
+    """Propagates one orbit's NEO API elements by `days` (scalar or array)."""
+    dt = np.atleast_1d(np.asarray(days, dtype=np.float64))
+    row = elements_array(elements)
+    if not 0.0 <= row[1] < 1.0:
+        raise ValueError(f"propagate handles elliptic orbits only, got eccentricity {row[1]}")
+    states = propagate_orbit(row, dt)
+    if np.ndim(days) == 0:
+        return OrbitState(states[0, :3], states[0, 3:])
+    return OrbitState(states[:, :3].T, states[:, 3:].T)
@@ -1,5 +1,56 @@
+import math
+from dataclasses import dataclass
+
 import numpy as np
 import pandas as pd
+from numba import njit, prange
+
+from .sampling import uniform_into
+
+# Sampling bounds, shared with the line-sampling case generator
+ALBEDO_RANGE = (0.02, 0.5)
+DENSITY_RANGE_KG_M3 = (1500, 7000)
+LOG_STRENGTH_RANGE_MPA = (-1, 1) # 0.1 to 10 MPa
+
+@dataclass
+class AsteroidProperties:
+    """Sampled asteroid properties stored as one NumPy array per property.
+
+    Keeping the structure-of-arrays layout lets numerical kernels take the
+    contiguous arrays directly; a DataFrame is only built for reporting.
+    """
+    h_magnitude: float
+    albedo: np.ndarray
+    diameter_m: np.ndarray
+    density_kg_m3: np.ndarray
+    mass_kg: np.ndarray
+    strength_mpa: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.diameter_m)
+
+    def to_frame(self) -> pd.DataFrame:
+        """Returns the properties as a DataFrame, one row per sample."""
+        return pd.DataFrame({
+            'h_magnitude': self.h_magnitude,
+            'albedo': self.albedo,
+            'diameter_m': self.diameter_m,
+            'density_kg_m3': self.density_kg_m3,
+            'mass_kg': self.mass_kg,
+            'strength_mpa': self.strength_mpa,
+        })
+
+@njit("void(float64, float64[:], float64[:], float64[:], float64[:], float64[:])",
+      parallel=True, fastmath=True, cache=True)
+def _derive_properties(h_magnitude, albedo, density_kg_m3, strength_mpa, diameter_m, mass_kg):
+    """Fills `diameter_m` and `mass_kg`, and turns the log-strength draws in `strength_mpa` into MPa in place."""
+    size_scale = 10.0**(-0.2 * h_magnitude) * 1000.0
+    for i in prange(albedo.shape[0]):
+        # D = 1329 / sqrt(albedo) * 10^(-0.2 * H)
+        d = 1329.0 / math.sqrt(albedo[i]) * size_scale
+        diameter_m[i] = d
+        mass_kg[i] = density_kg_m3[i] * (4.0 / 3.0) * math.pi * (0.5 * d)**3
+        strength_mpa[i] = 10.0**strength_mpa[i]
 
 class AsteroidPropertyGenerator:
     """Generates physically plausible asteroid properties based on statistical distributions.
@@ -8,16 +59,35 @@ class AsteroidPropertyGenerator:
     in the paper, sampling properties like diameter, density, and strength
     while considering correlations between them.
     """
-    def __init__(self, h_magnitude: float):
+    def __init__(self, h_magnitude: float, seed=None, *, albedo: float = None,
+                 diameter_m: float = None, density_kg_m3: float = None, strength_mpa: float = None):
         """Initializes the generator with a constraint.
 
+        Any property given as a keyword is forced to that value for every
+        sample instead of being drawn from its distribution.
+
         Args:
             h_magnitude (float): The asteroid's absolute magnitude (H), which
                 constrains the possible size range.
+            seed (int | np.random.Generator, optional): Seed or generator for
+                the sampling. Passing a Generator shares its stream.
+            albedo (float, optional): Forced geometric albedo.
+            diameter_m (float, optional): Forced diameter. Takes precedence
+                over `albedo`, which is then set to the value implied by H.
+            density_kg_m3 (float, optional): Forced bulk density.
+            strength_mpa (float, optional): Forced aerodynamic strength.
         """
         self.h_magnitude = h_magnitude
+        self.rng = np.random.default_rng(seed)
+        if diameter_m is not None:
+            # Invert D = 1329 / sqrt(albedo) * 10^(-0.2 * H), with D in km
+            albedo = (1329 * 10**(-0.2 * h_magnitude) / (diameter_m / 1000))**2
+        self.albedo = albedo
+        self.diameter_m = diameter_m
+        self.density_kg_m3 = density_kg_m3
+        self.strength_mpa = strength_mpa
 
-    def sample_properties(self, n_samples: int) -> pd.DataFrame:
+    def sample_properties(self, n_samples: int) -> AsteroidProperties:
         """Samples a set of asteroid properties.
 
         This is a simplified implementation. A real model would involve more
@@ -27,33 +97,51 @@ class AsteroidPropertyGenerator:
             n_samples (int): The number of property sets to generate.
 
         Returns:
-            pd.DataFrame: A DataFrame containing the sampled properties.
+            AsteroidProperties: The sampled properties, one array per property.
         """
+        # Every distribution is drawn even when forced, so forcing one property
+        # leaves the other samples unchanged for a given seed.
         # Albedo (log-uniform distribution)
-        albedo = np.random.uniform(0.02, 0.5, n_samples)
-
-        # Diameter (derived from H and albedo)
-        # D = 1329 / sqrt(albedo) * 10^(-0.2 * H)
-        diameter_km = (1329 / np.sqrt(albedo)) * (10**(-0.2 * self.h_magnitude))
-        diameter_m = diameter_km * 1000
+        albedo = uniform_into(self.rng, *ALBEDO_RANGE, np.empty(n_samples))
 
         # Density (bimodal distribution for stony vs. iron could be used)
         # Simplified uniform distribution for now.
-        density_kg_m3 = np.random.uniform(1500, 7000, n_samples)
-
-        # Mass (from diameter and density)
-        volume_m3 = (4/3) * np.pi * (diameter_m / 2)**3
-        mass_kg = density_kg_m3 * volume_m3
+        density_kg_m3 = uniform_into(self.rng, *DENSITY_RANGE_KG_M3, np.empty(n_samples))
 
         # Aerodynamic Strength (log-uniform)
-        strength_mpa = 10**np.random.uniform(-1, 1, n_samples) # 0.1 to 10 MPa
+        log_strength_mpa = uniform_into(self.rng, *LOG_STRENGTH_RANGE_MPA, np.empty(n_samples))
 
-        df = pd.DataFrame({
-            'h_magnitude': self.h_magnitude,
-            'albedo': albedo,
-            'diameter_m': diameter_m,
-            'density_kg_m3': density_kg_m3,
-            'mass_kg': mass_kg,
-            'strength_mpa': strength_mpa,
-        })
-        return df
\ No newline at end of file
+        if self.albedo is not None:
+            albedo.fill(self.albedo)
+        if self.density_kg_m3 is not None:
+            density_kg_m3.fill(self.density_kg_m3)
+        if self.strength_mpa is not None:
+            log_strength_mpa.fill(np.log10(self.strength_mpa))
+
+        return self.from_samples(albedo, density_kg_m3, log_strength_mpa)
+
+    def from_samples(self, albedo: np.ndarray, density_kg_m3: np.ndarray, log_strength_mpa: np.ndarray) -> AsteroidProperties:
+        """Builds the full property set from already drawn base variables.
+
+        Args:
+            albedo (np.ndarray): Geometric albedo per sample.
+            density_kg_m3 (np.ndarray): Bulk density per sample.
+            log_strength_mpa (np.ndarray): log10 of the aerodynamic strength
+                in MPa. Converted to MPa in place and kept as `strength_mpa`.
+
+        Returns:
+            AsteroidProperties: The properties, one array per property.
+        """
+        # Diameter (derived from H and albedo) and mass (from diameter and density)
+        diameter_m = np.empty(len(albedo))
+        mass_kg = np.empty(len(albedo))
+        _derive_properties(self.h_magnitude, albedo, density_kg_m3, log_strength_mpa, diameter_m, mass_kg)
+
+        return AsteroidProperties(
+            h_magnitude=self.h_magnitude,
+            albedo=albedo,
+            diameter_m=diameter_m,
+            density_kg_m3=density_kg_m3,
+            mass_kg=mass_kg,
+            strength_mpa=log_strength_mpa,
+        )
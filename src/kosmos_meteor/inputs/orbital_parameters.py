@@ -1,7 +1,15 @@
 import numpy as np
 import pandas as pd
 
-def load_orbital_data(filepath: str = None, num_samples: int = 1000) -> pd.DataFrame:
+from .sampling import uniform_into
+
+# Sampling bounds, shared with the line-sampling case generator
+LATITUDE_RANGE = (-90, 90)
+LONGITUDE_RANGE = (-180, 180)
+ENTRY_ANGLE_RANGE_DEG = (15, 75) # Relative to horizontal
+ENTRY_VELOCITY_RANGE_KMS = (11, 25)
+
+def load_orbital_data(filepath: str = None, num_samples: int = 1000, rng: np.random.Generator = None) -> pd.DataFrame:
     """Loads or generates sample orbital entry parameters.
 
     In a real scenario, this would parse a standard format file from CNEOS/JPL.
@@ -11,6 +19,8 @@ def load_orbital_data(filepath: str = None, num_samples: int = 1000) -> pd.DataF
         filepath (str, optional): Path to the orbital data file. If None,
             random data is generated.
         num_samples (int): Number of samples to generate if no file is provided.
+        rng (np.random.Generator, optional): Generator to draw from. A fresh,
+            unseeded one is used if None.
 
     Returns:
         pd.DataFrame: DataFrame with orbital entry parameters for each case.
@@ -21,10 +31,11 @@ def load_orbital_data(filepath: str = None, num_samples: int = 1000) -> pd.DataF
         raise NotImplementedError("File parsing is not yet implemented.")
     else:
         # Generate synthetic data
-        latitude = np.random.uniform(-90, 90, num_samples)
-        longitude = np.random.uniform(-180, 180, num_samples)
-        entry_angle_deg = np.random.uniform(15, 75, num_samples) # Relative to horizontal
-        entry_velocity_kms = np.random.uniform(11, 25, num_samples)
+        rng = np.random.default_rng(rng)
+        latitude = uniform_into(rng, *LATITUDE_RANGE, np.empty(num_samples))
+        longitude = uniform_into(rng, *LONGITUDE_RANGE, np.empty(num_samples))
+        entry_angle_deg = uniform_into(rng, *ENTRY_ANGLE_RANGE_DEG, np.empty(num_samples))
+        entry_velocity_kms = uniform_into(rng, *ENTRY_VELOCITY_RANGE_KMS, np.empty(num_samples))
 
         df = pd.DataFrame({
             'latitude': latitude,
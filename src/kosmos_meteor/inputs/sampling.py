@@ -0,0 +1,12 @@
+import numpy as np
+
+def uniform_into(rng: np.random.Generator, low: float, high: float, out: np.ndarray) -> np.ndarray:
+    """Fills `out` in place with samples from U(low, high) and returns it.
+
+    `Generator.uniform` has no `out=` argument, so the draw goes through
+    `Generator.random` and is rescaled without a temporary.
+    """
+    rng.random(out=out)
+    out *= high - low
+    out += low
+    return out
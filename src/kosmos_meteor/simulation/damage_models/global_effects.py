@@ -4,14 +4,14 @@ import pandas as pd
 class GlobalEffectsModel:
     """Estimates global climatic effects from large impacts."""
 
-    def calculate_damage(self, case: pd.Series, entry_result: dict) -> dict:
+    def calculate_damage(self, case: dict, entry_result: dict) -> dict:
         """Calculates the fraction of world population affected.
 
         This implements the exponential curve fit described in Figure 6 of the
         Wheeler et al. (2024) paper.
 
         Args:
-            case (pd.Series): The impact case data.
+            case (dict): The impact case data, keyed by column name.
             entry_result (dict): The results from the atmospheric entry simulation.
 
         Returns:
@@ -33,4 +33,25 @@ class GlobalEffectsModel:
             if log_e > 2:
                 fraction = min(1.0, 0.25 * (log_e - 2))
 
-        return {'global_effects_fraction': fraction}
\ No newline at end of file
+        return {'global_effects_fraction': fraction}
+
+    def run_batch(self, cases: pd.DataFrame, entry_results: pd.DataFrame) -> pd.DataFrame:
+        """Vectorized counterpart of `calculate_damage` over a whole cases DataFrame.
+
+        Args:
+            cases (pd.DataFrame): The impact cases DataFrame, one row per case.
+            entry_results (pd.DataFrame): The batched atmospheric entry results.
+
+        Returns:
+            pd.DataFrame: Columns keyed like `calculate_damage`'s output, on the cases index.
+        """
+        energy_gt = cases['impact_energy_mt'].to_numpy() / 1000  # Convert MT to Gigatons
+
+        # log10 is only meaningful above the ~40 Gt threshold, mask the rest
+        with np.errstate(divide='ignore', invalid='ignore'):
+            log_e = np.log10(energy_gt)
+        fraction = np.where(
+            (energy_gt > 40) & (log_e > 2), np.minimum(1.0, 0.25 * (log_e - 2)), 0.0
+        )
+
+        return pd.DataFrame({'global_effects_fraction': fraction}, index=cases.index)
\ No newline at end of file
@@ -1,14 +1,15 @@
+import math
 import numpy as np
 import pandas as pd
 
 class LocalDamageModel:
     """Estimates local ground damage from blast overpressure and thermal radiation."""
 
-    def calculate_damage(self, case: pd.Series, entry_result: dict) -> dict:
+    def calculate_damage(self, case: dict, entry_result: dict) -> dict:
         """Calculates blast and thermal damage radii.
 
         Args:
-            case (pd.Series): The impact case data.
+            case (dict): The impact case data, keyed by column name.
             entry_result (dict): The results from the atmospheric entry simulation.
 
         Returns:
@@ -18,7 +19,7 @@ class LocalDamageModel:
         thermal_radii = self._calculate_thermal(case, entry_result)
         return {**blast_radii, **thermal_radii}
 
-    def _calculate_blast(self, case: pd.Series, entry_result: dict) -> dict:
+    def _calculate_blast(self, case: dict, entry_result: dict) -> dict:
         """Calculates blast damage radii using a simplified scaling law.
 
         A real implementation would use interpolated Height-of-Burst (HOB) maps.
@@ -32,15 +33,16 @@ class LocalDamageModel:
         c_1psi = 1.5 # km/kt^(1/3)
         c_4psi = 0.6 # km/kt^(1/3)
 
-        radius_1psi = c_1psi * (yield_kt ** (1/3))
-        radius_4psi = c_4psi * (yield_kt ** (1/3))
+        yield_kt_cbrt = math.cbrt(yield_kt)
+        radius_1psi = c_1psi * yield_kt_cbrt
+        radius_4psi = c_4psi * yield_kt_cbrt
 
         return {
             'blast_radius_1psi_km': radius_1psi,
             'blast_radius_4psi_km': radius_4psi,
         }
 
-    def _calculate_thermal(self, case: pd.Series, entry_result: dict) -> dict:
+    def _calculate_thermal(self, case: dict, entry_result: dict) -> dict:
         """Calculates thermal damage radii.
 
         This is a placeholder. The model from the paper is more complex,
@@ -48,8 +50,26 @@ class LocalDamageModel:
         """
         yield_mt = case['impact_energy_mt']
         # Simplified: thermal damage is often smaller than blast for many sizes
-        thermal_radius_3rd_degree_burns = 0.5 * (yield_mt * 1000)**(1/3)
+        thermal_radius_3rd_degree_burns = 0.5 * math.cbrt(yield_mt * 1000)
 
         return {
             'thermal_radius_3rd_degree_burns_km': thermal_radius_3rd_degree_burns
-        }
\ No newline at end of file
+        }
+
+    def run_batch(self, cases: pd.DataFrame, entry_results: pd.DataFrame) -> pd.DataFrame:
+        """Vectorized counterpart of `calculate_damage` over a whole cases DataFrame.
+
+        Args:
+            cases (pd.DataFrame): The impact cases DataFrame, one row per case.
+            entry_results (pd.DataFrame): The batched atmospheric entry results.
+
+        Returns:
+            pd.DataFrame: Columns keyed like `calculate_damage`'s output, on the cases index.
+        """
+        yield_kt_cbrt = np.cbrt(cases['impact_energy_mt'].to_numpy() * 1000)
+
+        return pd.DataFrame({
+            'blast_radius_1psi_km': 1.5 * yield_kt_cbrt,
+            'blast_radius_4psi_km': 0.6 * yield_kt_cbrt,
+            'thermal_radius_3rd_degree_burns_km': 0.5 * yield_kt_cbrt,
+        }, index=cases.index)
\ No newline at end of file
@@ -6,11 +6,11 @@ import pandas as pd
 class TsunamiModel:
     """Estimates tsunami damage"""
 
-    def calculate_damage(self, case: pd.Series, entry_result: dict) -> dict:
+    def calculate_damage(self, case: dict, entry_result: dict) -> dict:
         """Calculates blast and thermal damage radii.
 
         Args:
-            case (pd.Series): The impact case data.
+            case (dict): The impact case data, keyed by column name.
             entry_result (dict): The results from the atmospheric entry simulation.
 
         Returns:
@@ -19,4 +19,16 @@ class TsunamiModel:
         #blast_radii = self._calculate_blast(case, entry_result)
         #thermal_radii = self._calculate_thermal(case, entry_result)
         #return {**blast_radii, **thermal_radii}
-        return {'tsunami_runup_m':0}
\ No newline at end of file
+        return {'tsunami_runup_m':0}
+
+    def run_batch(self, cases: pd.DataFrame, entry_results: pd.DataFrame) -> pd.DataFrame:
+        """Vectorized counterpart of `calculate_damage` over a whole cases DataFrame.
+
+        Args:
+            cases (pd.DataFrame): The impact cases DataFrame, one row per case.
+            entry_results (pd.DataFrame): The batched atmospheric entry results.
+
+        Returns:
+            pd.DataFrame: Columns keyed like `calculate_damage`'s output, on the cases index.
+        """
+        return pd.DataFrame({'tsunami_runup_m': np.zeros(len(cases))}, index=cases.index)
\ No newline at end of file
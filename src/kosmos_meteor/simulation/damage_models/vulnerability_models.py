@@ -1,6 +1,17 @@
+import math
 import numpy as np
 import pandas as pd
 
+def _seismic_distance_term(r_km: float) -> float:
+    """Magnitude drop with distance (Collins et al. 2005, Equation 41)."""
+    if r_km < 60:
+        return 0.0238 * r_km
+    elif r_km < 700:
+        return 0.0048 * r_km + 1.1644
+    else:
+        delta = r_km / 6371 # Earth radius
+        return 1.66 * math.log10(delta) + 6.399
+
 class VulnerabilityCalculator:
     """
     Calculates the severity of and vulnerability to the seven major asteroid
@@ -31,7 +42,7 @@ class VulnerabilityCalculator:
         self.P_A = 101325  # Ambient pressure in Pa
         self.C_0 = 330      # Speed of sound in m/s
 
-    def _calculate_overpressure_severity(self, case: pd.Series, entry_result: dict,distance_m : float) -> float:  # /!\ airbust = ground
+    def _calculate_overpressure_severity(self, case: dict, entry_result: dict,distance_m : float) -> float:  # /!\ airbust = ground
         """Calculates overpressure shockwave severity in Pascals (Pa)."""
         # in = case
         # ATTENTION : div/0 induit par distance
@@ -43,18 +54,20 @@ class VulnerabilityCalculator:
 
         if not is_airburst:  # Ground impact
             p_x, d_x = 75000, 290
-            scaled_distance = distance_m / (energy_kt**(1/3))
-            overpressure = (p_x * d_x * energy_kt**(1/3) / (4 * distance_m)) * \
-                           (1 + 3 * (d_x * energy_kt**(1/3) / distance_m)**1.3)
+            energy_kt_cbrt = math.cbrt(energy_kt)
+            scaled_distance = distance_m / energy_kt_cbrt
+            overpressure = (p_x * d_x * energy_kt_cbrt / (4 * distance_m)) * \
+                           (1 + 3 * (d_x * energy_kt_cbrt / distance_m)**1.3)
             return overpressure
         else: # Airburst
             # This is a simplified model. A full implementation would distinguish
             # between regular and Mach reflection regions.
             # Using the ground impact formula as a proxy for simplicity.
             p_x, d_x = 75000, 290
-            scaled_distance = distance_m / (energy_kt**(1/3))
-            overpressure = (p_x * d_x * energy_kt**(1/3) / (4 * distance_m)) * \
-                           (1 + 3 * (d_x * energy_kt**(1/3) / distance_m)**1.3)
+            energy_kt_cbrt = math.cbrt(energy_kt)
+            scaled_distance = distance_m / energy_kt_cbrt
+            overpressure = (p_x * d_x * energy_kt_cbrt / (4 * distance_m)) * \
+                           (1 + 3 * (d_x * energy_kt_cbrt / distance_m)**1.3)
             return overpressure
 
 
@@ -69,7 +82,7 @@ class VulnerabilityCalculator:
         denominator = (7 * self.P_A) * np.sqrt(1 + (6 * overpressure_pa) / (7 * self.P_A))
         return numerator / denominator if denominator != 0 else 0
 
-    def _calculate_thermal_severity(self, case: pd.Series, entry_result: dict,distance_m : float) -> float:
+    def _calculate_thermal_severity(self, case: dict, entry_result: dict,distance_m : float) -> float:
         """Calculates thermal radiation severity in Joules per square meter (J/m^2)."""
         # IN = case + random
         # attention : div/0 induit par distance
@@ -84,27 +97,20 @@ class VulnerabilityCalculator:
         thermal_exposure = (luminous_efficiency * energy_j) / (2 * np.pi * distance_m**2)
         return thermal_exposure
 
-    def _calculate_seismic_severity(self, case: pd.Series, entry_result: dict,distance_m : float) -> float:
+    def _calculate_seismic_severity(self, case: dict, entry_result: dict,distance_m : float) -> float:
         """Calculates seismic shaking severity in effective Richter scale magnitude."""
         # IN = case
         energy_j = case['impact_energy_mt'] * 4.184e15
         if energy_j <= 0:
             return 0.0
         # From Collins et al. 2005, Equation 40
-        magnitude = 0.67 * np.log10(energy_j) - 5.87
+        magnitude = 0.67 * math.log10(energy_j) - 5.87
         
         # From Collins et al. 2005, Equation 41
-        r_km = distance_m / 1000
-        if r_km < 60:
-            return magnitude - 0.0238 * r_km
-        elif 60 <= r_km < 700:
-            return magnitude - 0.0048 * r_km - 1.1644
-        else:
-            delta = r_km / 6371 # Earth radius
-            return magnitude - 1.66 * np.log10(delta) - 6.399
+        return magnitude - _seismic_distance_term(distance_m / 1000)
 
 
-    def _calculate_ejecta_severity(self, case: pd.Series, entry_result: dict, distance_m : float) -> float:
+    def _calculate_ejecta_severity(self, case: dict, entry_result: dict, distance_m : float) -> float:
         """Calculates ejecta blanket thickness in meters."""
         # IN = case + simplification
         # This requires transient crater diameter, which is not in the base PAIR output.
@@ -125,7 +131,7 @@ class VulnerabilityCalculator:
         """Generic sigmoid function for vulnerability models."""
         return a / (1 + np.exp(b * (x + c)))
 
-    def calculate_all_vulnerabilities(self, case: pd.Series, entry_result: dict) -> dict:
+    def calculate_all_vulnerabilities(self, case: dict, entry_result: dict) -> dict:
         """
         Calculates severity and vulnerability for all seven effects and the
         combined vulnerability.
@@ -178,8 +184,122 @@ class VulnerabilityCalculator:
         results['Combined'] = {'severity': "Overall", 'vulnerability': combined_vulnerability}
 
         return results
+
+    def run_batch(self, cases: pd.DataFrame, entry_results: pd.DataFrame, rng=None) -> pd.DataFrame:
+        """
+        Vectorized counterpart of `calculate_all_vulnerabilities` over a whole
+        cases DataFrame, evaluated at `self.distance_m`.
+
+        Returns a DataFrame on the cases index with one object column per effect,
+        holding a {'severity', 'vulnerability'} dict per case, so the output
+        matches the per-case method column for column. `rng` (a Generator)
+        drives the luminous-efficiency draw; NumPy's global state if None.
+        """
+        distance_m = self.distance_m
+        n_cases = len(cases)
+        rng = np.random if rng is None else rng
+        energy_mt = cases['impact_energy_mt'].to_numpy()
+        energy_kt = energy_mt * 1000
+        energy_j = energy_mt * 4.184e15
+        zeros = np.zeros(n_cases)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # 1. Overpressure (ground and airburst share the same formula)
+            p_x, d_x = 75000, 290
+            energy_kt_cbrt = np.cbrt(energy_kt)
+            # The scaled range d_x * E^(1/3) / r appears twice, compute it once
+            scaled_range = energy_kt_cbrt * (d_x / distance_m)
+            overpressure_sev = np.where(
+                energy_kt > 0,
+                (p_x / 4) * scaled_range * (1 + 3 * scaled_range**1.3),
+                0.0,
+            )
+
+            # 2. High Winds (ARMOR2, Equation 10)
+            numerator = 5 * overpressure_sev * self.C_0
+            denominator = (7 * self.P_A) * np.sqrt(1 + (6 * overpressure_sev) / (7 * self.P_A))
+            wind_sev = np.where(overpressure_sev > 0, numerator / denominator, 0.0)
+
+            # 3. Thermal Radiation (Collins et al. 2005, Equation 34)
+            luminous_efficiency = 10**rng.uniform(-4, -2, n_cases)
+            thermal_sev = np.where(
+                energy_j > 0,
+                luminous_efficiency * energy_j * (1 / (2 * np.pi * distance_m * distance_m)),
+                0.0,
+            )
+
+            # 4. Seismic Shaking (Collins et al. 2005, Equations 40-41)
+            # The distance term is one scalar for the whole batch, so it folds
+            # into the constant offset
+            magnitude_offset = 5.87 + _seismic_distance_term(distance_m / 1000)
+            seismic_sev = np.where(energy_j > 0, 0.67 * np.log10(energy_j) - magnitude_offset, 0.0)
+
+        # 5. Cratering
+        if 'final_crater_diameter_km' in cases:
+            final_crater_km = cases['final_crater_diameter_km'].to_numpy()
+        else:
+            final_crater_km = zeros
+        is_in_crater = distance_m < (final_crater_km * 1000 / 2)
+        crater_vuln = is_in_crater.astype(float)
+
+        # 6. Ejecta (Collins et al. 2005, Equation 47)
+        transient_crater_m = final_crater_km / 1.25 * 1000
+        if distance_m == 0:
+            ejecta_sev = np.where(final_crater_km > 0, np.inf, 0.0)
+        else:
+            ejecta_sev = np.where(
+                final_crater_km > 0,
+                np.where(
+                    distance_m > transient_crater_m / 2,
+                    np.square(np.square(transient_crater_m)) * (1 / (112 * distance_m**3)),
+                    np.inf,
+                ),
+                0.0,
+            )
+        ejecta_load_kpa = ejecta_sev * 1600 * 9.81 / 1000 # thickness * density * g
+        ejecta_vuln = 0.078 / ((1 + np.exp(-1.37 * (ejecta_load_kpa - 3.14)))**4.6)
+
+        # 7. Tsunami (Placeholder)
+        tsunami_vuln = zeros
+
+        vulnerabilities = {
+            'Overpressure': self._sigmoid(overpressure_sev, 1.0, -2.424e-5, -4.404e5),
+            'High Winds': self._sigmoid(wind_sev, 1.0, -5.483e-2, -1.124e2),
+            'Thermal Radiation': self._sigmoid(thermal_sev, 0.47, -5.623e-6, -7.316e5),
+            'Seismic Shaking': self._sigmoid(seismic_sev, 1.0, -2.516, -8.686),
+            'Cratering': crater_vuln,
+            'Ejecta': ejecta_vuln,
+            'Tsunami': tsunami_vuln,
+        }
+        severities = {
+            'Overpressure': [f"{sev/1e3:.2f} kPa" for sev in overpressure_sev],
+            'High Winds': [f"{sev:.2f} m/s" for sev in wind_sev],
+            'Thermal Radiation': [f"{sev/1e6:.2f} MJ/m^2" for sev in thermal_sev],
+            'Seismic Shaking': [f"{sev:.2f} Richter" for sev in seismic_sev],
+            'Cratering': ["Inside Crater" if c else "Outside Crater" for c in is_in_crater],
+            'Ejecta': [f"{sev:.2f} m" for sev in ejecta_sev],
+            'Tsunami': ["N/A (Land Impact)"] * n_cases,
+        }
+
+        # Combined Vulnerability
+        survivability = np.ones(n_cases)
+        for vuln in vulnerabilities.values():
+            survivability = survivability * (1 - vuln)
+        vulnerabilities['Combined'] = 1 - survivability
+        severities['Combined'] = ["Overall"] * n_cases
+
+        results = {}
+        for effect, vuln in vulnerabilities.items():
+            column = np.empty(n_cases, dtype=object)
+            column[:] = [
+                {'severity': sev, 'vulnerability': v}
+                for sev, v in zip(severities[effect], vuln.tolist())
+            ]
+            results[effect] = column
+
+        return pd.DataFrame(results, index=cases.index)
     
-    def loopdistance_calculate_all_vulnerabilities_dictdict(self, case: pd.Series, entry_result: dict) -> dict:
+    def loopdistance_calculate_all_vulnerabilities_dictdict(self, case: dict, entry_result: dict) -> dict:
         """
         Calculates severity and vulnerability for all seven effects across all distances,
         then computes the combined vulnerability at each distance.
@@ -272,7 +392,7 @@ class VulnerabilityCalculator:
 
         return df
 
-    def loopdistance_calculate_all_vulnerabilities_dictlist2df(self, case: pd.Series, entry_result: dict,b_pivot=True) -> dict:
+    def loopdistance_calculate_all_vulnerabilities_dictlist2df(self, case: dict, entry_result: dict,b_pivot=True) -> dict:
         """
         Calculates severity and vulnerability for all effects across all distances.
         Returns a dict structured per effect:
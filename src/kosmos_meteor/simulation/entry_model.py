@@ -1,5 +1,13 @@
+import numpy as np
 import pandas as pd
 
+# Burst heuristic constants, shared by the per-case and batched paths
+GROUND_IMPACT_DIAMETER_M = 500
+GROUND_IMPACT_STRENGTH_MPA = 5
+BURST_CEILING_KM = 40
+BURST_KM_PER_MPA = 4
+BURST_KM_PER_M = 1 / 10
+
 class FragmentCloudModel:
     """Simulates atmospheric entry and breakup of an asteroid.
 
@@ -7,12 +15,12 @@ class FragmentCloudModel:
     A real implementation would solve differential equations of motion,
     ablation, and fragmentation.
     """
-    def run_entry(self, case: pd.Series) -> dict:
+    def run_entry(self, case: dict) -> dict:
         """Calculates the effective burst altitude and surface impact energy.
 
         Args:
-            case (pd.Series): A row from the impact cases DataFrame containing
-                all input parameters for a single case.
+            case (dict): A row from the impact cases DataFrame, keyed by
+                column name, containing all input parameters for a single case.
 
         Returns:
             dict: A dictionary with key results like 'burst_altitude_km' and
@@ -25,15 +33,42 @@ class FragmentCloudModel:
         impact_energy = case['impact_energy_mt']
 
         # Heuristic for burst altitude
-        if diameter > 500 or strength > 5:  # Large or strong object
+        if diameter > GROUND_IMPACT_DIAMETER_M or strength > GROUND_IMPACT_STRENGTH_MPA:  # Large or strong object
             burst_altitude_km = 0
             surface_impact_energy_mt = impact_energy
         else:
             # Weaker objects burst higher
-            burst_altitude_km = max(0, 40 - (strength * 4) - (diameter / 10))
+            burst_altitude_km = max(0, BURST_CEILING_KM - (strength * BURST_KM_PER_MPA) - (diameter * BURST_KM_PER_M))
             surface_impact_energy_mt = 0 # Assume full airburst
 
         return {
             'burst_altitude_km': burst_altitude_km,
             'surface_impact_energy_mt': surface_impact_energy_mt
-        }
\ No newline at end of file
+        }
+
+    def run_batch(self, cases: pd.DataFrame) -> pd.DataFrame:
+        """Vectorized counterpart of `run_entry` over a whole cases DataFrame.
+
+        Args:
+            cases (pd.DataFrame): The impact cases DataFrame, one row per case.
+
+        Returns:
+            pd.DataFrame: Columns keyed like `run_entry`'s output, on the cases index.
+        """
+        strength = cases['strength_mpa'].to_numpy()
+        diameter = cases['diameter_m'].to_numpy()
+        impact_energy = cases['impact_energy_mt'].to_numpy()
+
+        # Same heuristic as `run_entry`, evaluated for every case at once
+        is_ground_impact = (diameter > GROUND_IMPACT_DIAMETER_M) | (strength > GROUND_IMPACT_STRENGTH_MPA)
+        burst_altitude_km = np.where(
+            is_ground_impact,
+            0.0,
+            np.maximum(0, BURST_CEILING_KM - (strength * BURST_KM_PER_MPA) - (diameter * BURST_KM_PER_M)),
+        )
+        surface_impact_energy_mt = np.where(is_ground_impact, impact_energy, 0.0)
+
+        return pd.DataFrame({
+            'burst_altitude_km': burst_altitude_km,
+            'surface_impact_energy_mt': surface_impact_energy_mt
+        }, index=cases.index)
\ No newline at end of file
@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from kosmos_meteor.inputs.case_generator import (
+    LINE_SAMPLING_VARIABLES,
+    _cases_from_standard_normal,
+    generate_cases_line_sampling,
+)
+
+H_MAGNITUDE = 22.0
+N_VARIABLES = len(LINE_SAMPLING_VARIABLES)
+
+
+def _strong_and_fast(threshold):
+    # Fails for strong bodies entering fast: depends on two of the inputs
+    return lambda cases: threshold - _score(cases)
+
+
+def _score(cases):
+    return np.log10(cases['strength_mpa']) + 0.05 * cases['entry_velocity_kms']
+
+
+@pytest.fixture(scope="module")
+def crude_cases():
+    rng = np.random.default_rng(11)
+    return _cases_from_standard_normal(rng.standard_normal((N_VARIABLES, 400_000)), H_MAGNITUDE)
+
+
+@pytest.mark.parametrize("sign", [1.0, -1.0])
+def test_line_sampling_matches_crude_monte_carlo(crude_cases, sign):
+    g = _strong_and_fast(np.quantile(_score(crude_cases), 0.99))
+    p_crude = np.mean(g(crude_cases) <= 0)
+
+    direction = np.zeros(N_VARIABLES)
+    direction[2], direction[6] = 1.0, 0.3  # log_strength_mpa, entry_velocity_kms
+    # A reversed direction crosses every line the other way round and must
+    # give the same estimate, not zero
+    cases = generate_cases_line_sampling(400, H_MAGNITUDE, g, sign * direction, seed=5)
+
+    assert cases['line_weight'].mean() == pytest.approx(p_crude, rel=0.15)
@@ -0,0 +1,17 @@
+import pandas as pd
+import pandas.testing as pdt
+
+from kosmos_meteor.core.orchestrator import Orchestrator
+
+CONFIG = {"num_cases": 25, "h_magnitude": 21.0, "seed": 3}
+
+
+def test_chunked_pool_matches_serial(tmp_path):
+    # Three chunks through the process pool must reproduce the in-process run
+    serial_path, pooled_path = tmp_path / "serial.csv", tmp_path / "pooled.csv"
+    serial = Orchestrator(CONFIG).run_simulation(serial_path, chunk_size=10, max_workers=1)
+    pooled = Orchestrator(CONFIG).run_simulation(pooled_path, chunk_size=10, max_workers=2)
+
+    pdt.assert_frame_equal(pooled, serial)
+    pdt.assert_frame_equal(pd.read_csv(pooled_path), pd.read_csv(serial_path))
+    assert len(pd.read_csv(pooled_path)) == CONFIG["num_cases"]
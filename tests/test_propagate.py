@@ -0,0 +1,74 @@
+import math
+
+import numpy as np
+import pytest
+
+from kosmos_meteor.impacter.orbit.propagate import (
+    AU_KM,
+    ELEMENT_KEYS,
+    GM_SUN,
+    elements_from_state,
+    kepler_solve,
+    propagate,
+    propagate_batch,
+    propagate_orbit,
+)
+
+ELEMENTS = {
+    "semi_major_axis": 1.3,
+    "eccentricity": 0.4,
+    "inclination": 12.0,
+    "ascending_node_longitude": 80.0,
+    "perihelion_argument": 140.0,
+    "mean_anomaly": 25.0,
+}
+
+
+def _period_days(a_au):
+    return 2.0 * math.pi * math.sqrt((a_au * AU_KM) ** 3 / GM_SUN) / 86400.0
+
+
+@pytest.mark.parametrize("ecc", [0.0, 0.1, 0.5, 0.9, 0.99, 0.999])
+def test_kepler_residual(ecc):
+    for M in np.linspace(-math.pi, math.pi, 721):
+        E = kepler_solve(M, ecc)
+        assert abs(E - ecc * math.sin(E) - M) < 1e-10
+
+
+def test_elements_round_trip():
+    state = propagate(ELEMENTS, 0.0)
+    recovered = elements_from_state(state.r, state.v)
+    np.testing.assert_allclose(recovered, [ELEMENTS[key] for key in ELEMENT_KEYS], rtol=1e-9, atol=1e-8)
+
+
+def test_orbit_closes_after_one_period():
+    start, end = propagate(ELEMENTS, np.array([0.0, _period_days(ELEMENTS["semi_major_axis"])])).r.T
+    assert np.linalg.norm(end - start) < 1e-6 * np.linalg.norm(start)
+
+
+def test_energy_is_conserved():
+    state = propagate(ELEMENTS, np.linspace(0.0, 2000.0, 400))
+    energy = 0.5 * np.sum(state.v ** 2, axis=0) - GM_SUN / np.linalg.norm(state.r, axis=0)
+    expected = -GM_SUN / (2.0 * ELEMENTS["semi_major_axis"] * AU_KM)
+    np.testing.assert_allclose(energy, expected, rtol=1e-9)
+
+
+def test_batch_matches_single_orbit():
+    row = np.array([ELEMENTS[key] for key in ELEMENT_KEYS])
+    days = np.linspace(0.0, 500.0, 50)
+    np.testing.assert_allclose(
+        propagate_batch(np.tile(row, (len(days), 1)), days), propagate_orbit(row, days), rtol=1e-9
+    )
+
+
+@pytest.mark.parametrize("ecc", [-0.1, 1.0, 1.5, np.nan])
+def test_non_elliptic_rows_raise(ecc):
+    row = np.array([ELEMENTS[key] for key in ELEMENT_KEYS])
+    bad = np.tile(row, (3, 1))
+    bad[1, 1] = ecc
+    with pytest.raises(ValueError):
+        propagate_batch(bad, np.zeros(3))
+    with pytest.raises(ValueError):
+        propagate_orbit(bad[1].copy(), np.zeros(3))
+    with pytest.raises(ValueError):
+        propagate(dict(ELEMENTS, eccentricity=ecc), 0.0)
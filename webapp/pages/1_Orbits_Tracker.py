@@ -1,16 +1,12 @@
 import streamlit as st
+from pathlib import Path
 import requests
-import asyncio
-import numpy as np
-import plotly.graph_objects as go
-from astropy import units as u
-from kosmos_meteor.impacter.data.neo import fetch_neo
-from kosmos_meteor.impacter.orbit.propagate import propagate
-from kosmos_meteor.impacter.impact.compute import compute_impact
-from poliastro.twobody import Orbit
-from poliastro.bodies import Sun
-from astropy import units as u
+from requests.adapters import HTTPAdapter
 import numpy as np
+import pandas as pd
+from kosmos_meteor.impacter.data.neo import fetch_neo_sync
+# Plotly and the numba kernels are imported where they are first used, so
+# the Sentry list renders before their import cost is paid
 
 # -----------------------------
 # Streamlit page config
@@ -25,10 +21,37 @@ st.header("1️⃣ Select a Sentry (Impact-Risk) Object")
 
 # Query Sentry summary
 SENTRY_API = "https://ssd-api.jpl.nasa.gov/sentry.api"
+
+# One keep-alive session per process, shared by the Sentry and NEO calls, so
+# cache misses skip the TLS handshake
+@st.cache_resource
+def _http_session() -> requests.Session:
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+    return session
+
+# Sentry and NEO data change over hours, not widget interactions: every
+# rerun within the hour is served from the cache instead of the network
+@st.cache_data(ttl=3600, show_spinner=False)
+def _fetch_sentry_summary() -> dict:
+    resp = _http_session().get(SENTRY_API, timeout=10)
+    resp.raise_for_status()
+    return resp.json()
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _fetch_sentry_detail(des: str) -> dict:
+    resp = _http_session().get(SENTRY_API, params={"des": des}, timeout=10)
+    resp.raise_for_status()
+    return resp.json()
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _fetch_neo_cached(des: str) -> dict:
+    # A plain blocking GET: one request gains nothing from an event loop
+    return fetch_neo_sync(des, _http_session())
+
 # mode S (default) returns summary of objects
 try:
-    resp = requests.get(SENTRY_API)
-    sentry_summary = resp.json()
+    sentry_summary = _fetch_sentry_summary()
     # The JSON has e.g. a “data” field with list of objects
     items = sentry_summary.get("data", [])
 except Exception as e:
@@ -36,17 +59,22 @@ except Exception as e:
     st.stop()
 
 # Build options: designation + perhaps H or diameter as label
-options = {}
-for obj in items:
-    des = obj.get("des")  # e.g. "99942"
-    name = obj.get("fullname", des)
-    h = obj.get("h")  # absolute magnitude
-    diam = obj.get("diameter")  # in km
-    v_inf = obj.get("v_inf")  # km/s
-    cum_prob = obj.get("ps_cum")
+@st.cache_data(show_spinner=False)
+def _sentry_options(items: list) -> dict:
+    """Maps one selectbox label per Sentry object to its designation."""
+    # des e.g. "99942", h absolute magnitude, diameter in km, v_inf in km/s
+    df = pd.DataFrame(items, columns=["des", "fullname", "h", "diameter", "v_inf", "ps_cum"])
+    df["fullname"] = df["fullname"].fillna(df["des"])
+    # Missing fields read "None", as the f-string labels always did
+    text = df.astype("string").fillna("None")
     #label = f"{name} — H={h} — D≈{diam:.3f} km — v_inf={v_inf:.2f} km/s"
-    label = f"Name = {name}  — Summary : Cumulative Impact Prob≈{cum_prob} — H={h} — D≈{diam} km — v_inf={v_inf} km/s"
-    options[label] = des
+    labels = (
+        "Name = " + text["fullname"] + "  — Summary : Cumulative Impact Prob≈" + text["ps_cum"]
+        + " — H=" + text["h"] + " — D≈" + text["diameter"] + " km — v_inf=" + text["v_inf"] + " km/s"
+    )
+    return dict(zip(labels, df["des"]))
+
+options = _sentry_options(items)
 
 if not options:
     st.error("No Sentry objects found.")
@@ -62,8 +90,7 @@ st.header("2️⃣ Load Object & Orbit Data")
 
 # Fetch Sentry detailed info (mode O)
 try:
-    resp_det = requests.get(f"{SENTRY_API}?des={sentry_des}")
-    sentry_detail = resp_det.json()
+    sentry_detail = _fetch_sentry_detail(sentry_des)
 except Exception as e:
     st.error(f"Failed fetching Sentry details: {e}")
     st.stop()
@@ -238,15 +265,19 @@ with st.expander(f"ℹ️📡 NASA JPL NEO API Data Explained", expanded=False):
     """)
 
 
-# Display a local image file
-st.image("webapp/images/neo_schema.png", caption="Asteroid Orbit Diagram", width=400)
+# Display a local image file, read from disk once per process
+@st.cache_data
+def _neo_schema_bytes() -> bytes:
+    return Path("webapp/images/neo_schema.png").read_bytes()
+
+st.image(_neo_schema_bytes(), caption="Asteroid Orbit Diagram", width=400)
 
 
 
 neo_data = None
 elements = None
 try:
-    neo_data = asyncio.run(fetch_neo(sentry_des))
+    neo_data = _fetch_neo_cached(sentry_des)
     elements = neo_data["orbital_data"]
     st.success(f"Loaded orbit from NEO API for {sentry_des}")
     with st.expander(f"🗄️📡 NEO details for {sentry_des}", expanded=False):
@@ -264,25 +295,29 @@ except Exception as e:
 # -----------------------------
 st.header("3️⃣ Physical / Impact Parameters (editable)")
 
-col1, col2 = st.columns(2)
-with col1:
-    # size: diam → convert to radius, then mass if density known
-    diam_km = default_diam  # in km
-    # ask user to input diameter or keep default
-    diam_input = st.number_input(
-        "Estimated diameter (km)", value=float(diam_km), min_value=0.0001, step=0.0001, format="%.6f"
-    )
-    density = st.number_input("Density (kg/m³)", min_value=500, max_value=8000, value=3000)
-    # compute a default mass from diam & density
-    # diam_input in km → convert to m
-    radius_m = (diam_input * 1e3) / 2
-    default_mass = (4/3) * np.pi * radius_m**3 * density
-    mass = st.number_input("Mass (kg)", value=float(default_mass), min_value=1e3, step=1e5, format="%.3e")
-with col2:
-    # default velocity from v_inf (km/s)
-    v_inf_default = default_v_inf
-    velocity = st.number_input("Relative velocity (km/s)", value=float(v_inf_default), step=0.1, format="%.2f")
-    entry_angle = st.slider("Entry angle (° from horizontal)", 0, 90, 45)
+# A form holds edits client-side: the page reruns once per "Apply", not once
+# per keystroke, and the widgets return their last applied values meanwhile
+with st.form("phys_params"):
+    col1, col2 = st.columns(2)
+    with col1:
+        # size: diam → convert to radius, then mass if density known
+        diam_km = default_diam  # in km
+        # ask user to input diameter or keep default
+        diam_input = st.number_input(
+            "Estimated diameter (km)", value=float(diam_km), min_value=0.0001, step=0.0001, format="%.6f"
+        )
+        density = st.number_input("Density (kg/m³)", min_value=500, max_value=8000, value=3000)
+        # compute a default mass from diam & density
+        # diam_input in km → convert to m
+        radius_m = (diam_input * 1e3) / 2
+        default_mass = (4/3) * np.pi * radius_m**3 * density
+        mass = st.number_input("Mass (kg)", value=float(default_mass), min_value=1e3, step=1e5, format="%.3e")
+    with col2:
+        # default velocity from v_inf (km/s)
+        v_inf_default = default_v_inf
+        velocity = st.number_input("Relative velocity (km/s)", value=float(v_inf_default), step=0.1, format="%.2f")
+        entry_angle = st.slider("Entry angle (° from horizontal)", 0, 90, 45)
+    st.form_submit_button("Apply")
 
 # -----------------------------
 # 4️⃣ Propagation period & orbit plotting
@@ -304,10 +339,10 @@ with st.expander(f"ℹ️📡 How to Propagate Orbits", expanded=False):
     - **Inclination (inc):** Tilt of the orbit relative to the ecliptic plane (Earth's orbital plane).  
     - **Longitude of ascending node (RAAN):** Angle from a reference direction to where the asteroid crosses the ecliptic plane going north.  
     - **Argument of perihelion (argp):** Angle from the ascending node to the orbit’s closest approach to the Sun.  
-    - **True anomaly (nu):** Position of the asteroid along its orbit at the starting epoch; defines where we begin propagation.
+    - **Mean anomaly (M):** Position of the asteroid along its orbit at the starting epoch, as a fraction of the orbital period in degrees; defines where we begin propagation.
 
     **Propagation calculation:**  
-    The orbit is advanced in time by numerically computing (using *poliastro*) the asteroid's position at each time step. We then extract the x and y coordinates to plot its path in the plane.  
+    The orbit is advanced in time by solving Kepler's equation for the asteroid's position at each time step. We then extract the x and y coordinates to plot its path in the plane.  
 
     **Plot elements:**  
     - Orange line: Asteroid's path.  
@@ -316,26 +351,41 @@ with st.expander(f"ℹ️📡 How to Propagate Orbits", expanded=False):
 
     **Limitations:**  
     - The plot assumes only Sun’s gravity (two-body problem); perturbations from planets are ignored.  
-    - True anomaly is used for the initial position; mean anomaly alone would not give the exact location.  
+    - The mean anomaly at epoch is converted to the true anomaly through Kepler's equation to place the asteroid.  
     - Units are simplified for visualization; real orbits are three-dimensional and can be affected by other forces.
     """)
 
+import plotly.graph_objects as go
+from kosmos_meteor.impacter.orbit.propagate import propagate, propagate_orbit, elements_array, elements_from_state
+
 # Propagate orbit
 time_steps = np.linspace(0, prop_days, num=200)
 
-x_positions = []
-y_positions = []
-for t in time_steps:
-    orb = propagate(elements, t)
-    x_positions.append(orb.r[0].to_value())
-    y_positions.append(orb.r[1].to_value())
+# Trajectories only depend on the orbit and the period: reruns triggered by
+# any other widget reuse the ones kept in this session. The element values
+# are part of the key, so a new orbit solution after the NEO cache expires
+# replaces the stored trajectory instead of being masked by it
+traj_key = (sentry_des, *elements_array(elements), prop_days)
+traj_cache = st.session_state.get("traj_cache", (None,))
+if traj_cache[0] == traj_key:
+    xy = traj_cache[1]
+else:
+    orb = propagate(elements, time_steps)
+    # The solver works in float64; float32 is plenty for a 600 px chart and
+    # halves the bytes sent to the browser
+    xy = orb.r[:2].astype(np.float32)
+    st.session_state["traj_cache"] = (traj_key, xy)
+x_positions = xy[0]
+y_positions = xy[1]
 
 # Plot
 fig = go.Figure()
+# WebGL traces ship the arrays as typed buffers and draw on the GPU; the
+# single-point Earth markers stay SVG text
 fig.add_trace(
-    go.Scatter(
-        x=np.array(x_positions),
-        y=np.array(y_positions),
+    go.Scattergl(
+        x=x_positions,
+        y=y_positions,
         mode="lines",
         name="Asteroid path",
         line=dict(color="orange", width=2),
@@ -352,19 +402,21 @@ fig.add_trace(
         hoverinfo="skip",
     )
 )
-x_margin = (max(x_positions) - min(x_positions)) * 0.1
-y_margin = (max(y_positions) - min(y_positions)) * 0.1
+# One reduction pass for both axes' extents
+(x_min, y_min), (x_max, y_max) = xy.min(axis=1), xy.max(axis=1)
+x_margin = (x_max - x_min) * 0.1
+y_margin = (y_max - y_min) * 0.1
 fig.update_layout(
     title=f"Orbit over {prop_days} days",
     xaxis=dict(
         title="x (km)",
         scaleanchor="y",
         scaleratio=1,
-        range=[min(min(x_positions), -x_margin), max(max(x_positions), x_margin)],
+        range=[min(x_min, -x_margin), max(x_max, x_margin)],
     ),
     yaxis=dict(
         title="y (km)",
-        range=[min(min(y_positions), -y_margin), max(max(y_positions), y_margin)],
+        range=[min(y_min, -y_margin), max(y_max, y_margin)],
     ),
     width=600,
     height=600,
@@ -377,7 +429,15 @@ st.plotly_chart(fig, use_container_width=False)
 # -----------------------------
 st.header("5️⃣ Estimate Impact Consequences")
 
-impact = compute_impact(
+from kosmos_meteor.impacter.impact.compute import compute_impact
+
+# Pure in its inputs, so reruns from unrelated widgets (propagation period,
+# deflection) reuse the last result
+@st.cache_data(show_spinner=False)
+def _compute_impact_cached(mass: float, density: float, velocity: float, angle: float) -> dict:
+    return compute_impact(mass=mass, density=density, velocity=velocity, angle=angle)
+
+impact = _compute_impact_cached(
     mass=mass, density=density, velocity=velocity, angle=entry_angle
 )
 
@@ -453,64 +513,41 @@ We apply Δv to the asteroid’s velocity vector at the start of the propagation
 then re-compute its new trajectory using the same two-body dynamics.
 """)
 
-# Map NEO API elements to poliastro
-a   = float(elements["semi_major_axis"]) * u.AU
-ecc = float(elements["eccentricity"]) * u.one
-inc = float(elements["inclination"]) * u.deg
-raan= float(elements["ascending_node_longitude"]) * u.deg
-argp= float(elements["perihelion_argument"]) * u.deg
-# NEO API gives mean anomaly, but we need true anomaly at epoch
-M   = float(elements.get("mean_anomaly", 0.0)) * u.deg
-
-
-
-# Baseline orbit
-# orb_base = Orbit.from_classical(
-#     attractor=Sun,
-#     a=elements["semi_major_axis"] * u.AU,
-#     ecc=elements["eccentricity"] * u.one,
-#     inc=elements["inclination"] * u.deg,
-#     raan=elements["raan"] * u.deg,
-#     argp=elements["argp"] * u.deg,
-#     nu=elements["nu"] * u.deg,
-# )
-orb_base = Orbit.from_classical(Sun, a, ecc, inc, raan, argp, M)
-
-
-# Apply delta_v as before
-v_vec = orb_base.v.to(u.m / u.s)
-v_hat = v_vec / np.linalg.norm(v_vec)
-v_new = v_vec + delta_v * u.m / u.s
-v_new = v_new.to(u.km / u.s)
-
-orb_deflected = Orbit.from_vectors(Sun, orb_base.r, v_new)
-
-# Propagate both
-x_base, y_base, x_defl, y_defl = [], [], [], []
-for t in np.linspace(0, prop_days, 200) * u.day:
-    o_base_t = orb_base.propagate(t)
-    o_defl_t = orb_deflected.propagate(t)
-    x_base.append(o_base_t.r[0].to(u.km).value)
-    y_base.append(o_base_t.r[1].to(u.km).value)
-    x_defl.append(o_defl_t.r[0].to(u.km).value)
-    y_defl.append(o_defl_t.r[1].to(u.km).value)
-
-
-# Plot
-fig_defl = go.Figure()
-fig_defl.add_trace(go.Scatter(x=x_base, y=y_base, mode="lines", name="Original Orbit", line=dict(color="orange", width=2)))
-fig_defl.add_trace(go.Scatter(x=x_defl, y=y_defl, mode="lines", name="Deflected Orbit", line=dict(color="cyan", width=2, dash="dash")))
-fig_defl.add_trace(go.Scatter(x=[0], y=[0], mode="text", text=["🌍"], textfont=dict(size=20), name="Earth", hoverinfo="skip"))
-
-fig_defl.update_layout(
-    title="Orbit Comparison Before and After Deflection",
-    xaxis_title="x (km)",
-    yaxis_title="y (km)",
-    width=700, height=700,
-    legend=dict(x=0.02, y=0.98),
-    xaxis=dict(scaleanchor="y", scaleratio=1)
-)
-st.plotly_chart(fig_defl, use_container_width=True)
+if method == "None":
+    st.caption("Choose a deflection method above to compare the deflected orbit with the original one.")
+else:
+    # The baseline is the Section 4 orbit: same elements, same time steps
+    x_base, y_base = x_positions, y_positions
+
+    if delta_v == 0.0:
+        # Nothing to apply, the deflected orbit is the baseline
+        x_defl, y_defl = x_base, y_base
+    elif (defl_cache := st.session_state.get("defl_cache", (None,)))[0] == (*traj_key, round(delta_v, 9)):
+        x_defl, y_defl = defl_cache[1]
+    else:
+        # Apply delta_v tangentially (m/s -> km/s) at epoch, then refit the elements
+        orb_epoch = propagate(elements, 0.0)
+        v_new = orb_epoch.v * (1.0 + (delta_v / 1e3) / np.linalg.norm(orb_epoch.v))
+        defl_elements = elements_from_state(orb_epoch.r, v_new)
+        states_defl = propagate_orbit(defl_elements, time_steps)
+        x_defl, y_defl = states_defl[:, :2].T.astype(np.float32)
+        st.session_state["defl_cache"] = ((*traj_key, round(delta_v, 9)), (x_defl, y_defl))
+
+    # Plot
+    fig_defl = go.Figure()
+    fig_defl.add_trace(go.Scattergl(x=x_base, y=y_base, mode="lines", name="Original Orbit", line=dict(color="orange", width=2)))
+    fig_defl.add_trace(go.Scattergl(x=x_defl, y=y_defl, mode="lines", name="Deflected Orbit", line=dict(color="cyan", width=2, dash="dash")))
+    fig_defl.add_trace(go.Scatter(x=[0], y=[0], mode="text", text=["🌍"], textfont=dict(size=20), name="Earth", hoverinfo="skip"))
+
+    fig_defl.update_layout(
+        title="Orbit Comparison Before and After Deflection",
+        xaxis_title="x (km)",
+        yaxis_title="y (km)",
+        width=700, height=700,
+        legend=dict(x=0.02, y=0.98),
+        xaxis=dict(scaleanchor="y", scaleratio=1)
+    )
+    st.plotly_chart(fig_defl, use_container_width=True)
 
 st.markdown(f"""
 ### Summary
@@ -1,7 +1,6 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
 import plotly.graph_objects as go
 
 # It's better to organize the project with a clear structure
@@ -176,22 +175,36 @@ num_cases = st.sidebar.select_slider(
     help="The number of simulations to run. More cases give better statistics but take longer."
 )
 
-# In-memory cache for simulation results
-@st.cache_data
-def run_cached_simulation(config):
-    """Runs the simulation and caches the result."""
-    orchestrator = Orchestrator(config)
-    results_df = orchestrator.run_simulation()
-    return results_df
-
-if st.sidebar.button("Run Simulation"):
+def histogram_figure(values, title, x_label, bins=50):
+    """Bins `values` with NumPy and draws the counts as a bar chart."""
+    counts, edges = np.histogram(values, bins=bins)
+    fig = go.Figure(go.Bar(x=(edges[:-1] + edges[1:]) / 2, y=counts, width=np.diff(edges)))
+    fig.update_layout(title=title, xaxis_title=x_label, yaxis_title="count", bargap=0)
+    return fig
+
+# Cache for simulation results, persisted to disk so that a restart or
+# redeploy doesn't force re-running the large configurations
+@st.cache_data(persist="disk", max_entries=50, show_spinner=False)
+def run_cached_simulation(h_magnitude: float, num_cases: int):
+    """Runs the simulation and caches the result, keyed on the two inputs."""
     scenario_config = {
         "h_magnitude": h_magnitude,
         "num_cases": num_cases,
         "distance_km": 0,
     }
+    # Building the orchestrator only instantiates the models (no data is
+    # loaded), so there is nothing worth keeping in st.cache_resource
+    orchestrator = Orchestrator(scenario_config)
+    results_df = orchestrator.run_simulation()
+    # float32 is plenty for plotting and halves what the cache and the
+    # browser have to hold
+    float_columns = results_df.select_dtypes('float64').columns
+    results_df[float_columns] = results_df[float_columns].astype(np.float32)
+    return results_df
+
+if st.sidebar.button("Run Simulation"):
     with st.spinner(f"Running {num_cases} simulations..."):
-        results_df = run_cached_simulation(scenario_config)
+        results_df = run_cached_simulation(h_magnitude, num_cases)
         st.session_state['results_df'] = results_df
         st.success("Simulation complete!")
 
@@ -201,10 +214,16 @@ if 'results_df' in st.session_state:
 
     # Display key metrics
     col1, col2, col3, col4 = st.columns(4)
-    mean_diameter = results_df['diameter_m'].mean()
-    mean_energy = results_df['impact_energy_mt'].mean()
-    mean_max_affected_pop = results_df['max_affected_population'].mean()
-    max_max_affected_pop = results_df['max_affected_population'].max()    
+    # One aggregation call over the three columns, rather than a reduction each
+    stats = results_df.agg({
+        'diameter_m': 'mean',
+        'impact_energy_mt': 'mean',
+        'max_affected_population': ['mean', 'max'],
+    })
+    mean_diameter = stats.at['mean', 'diameter_m']
+    mean_energy = stats.at['mean', 'impact_energy_mt']
+    mean_max_affected_pop = stats.at['mean', 'max_affected_population']
+    max_max_affected_pop = stats.at['max', 'max_affected_population']
     col1.metric("Mean Diameter (m)", f"{mean_diameter:.2f}")
     col2.metric("Mean Impact Energy (MT)", f"{mean_energy:.2f}")
     col3.metric("Mean Max Affected Population", f"{int(mean_max_affected_pop):,}")
@@ -212,24 +231,31 @@ if 'results_df' in st.session_state:
 
     # Display "wow" visualization
     st.subheader("Impact Energy vs. Affected Population")
-    fig_wow = px.scatter(
-        results_df,
-        x="impact_energy_mt",
-        y="max_affected_population",
-        size="diameter_m",
-        color="strength_mpa",
-        hover_name=results_df.index,
-        #log_x=True,
-        #log_y=True,
+    # WebGL keeps thousands of bubbles responsive, where SVG adds one node per point
+    diameter_m = results_df['diameter_m'].to_numpy()
+    fig_wow = go.Figure(go.Scattergl(
+        x=results_df['impact_energy_mt'].to_numpy(),
+        y=results_df['max_affected_population'].to_numpy(),
+        mode='markers',
+        marker=dict(
+            size=diameter_m,
+            sizemode='area',
+            sizeref=2 * diameter_m.max() / 60**2,  # largest bubble 60 px, as px's size_max
+            color=results_df['strength_mpa'].to_numpy(),
+            colorscale='Plasma',
+            colorbar=dict(title="Strength (MPa)"),
+        ),
+        customdata=np.column_stack([results_df.index, diameter_m]),
+        hovertemplate="Case %{customdata[0]}<br>Impact Energy (Megatons): %{x}"
+                      "<br>Max Affected Population: %{y}<br>Diameter (m): %{customdata[1]:.1f}"
+                      "<br>Strength (MPa): %{marker.color:.2f}<extra></extra>",
+    ))
+    fig_wow.update_layout(
         title="Each bubble represents a simulated impact scenario",
-        labels={
-            "impact_energy_mt": "Impact Energy (Megatons) - Log Scale",
-            "max_affected_population": "Max Affected Population - Log Scale",
-            "diameter_m": "Diameter (m)",
-            "strength_mpa": "Strength (MPa)"
-        },
-        color_continuous_scale=px.colors.sequential.Plasma,
-        size_max=60
+        xaxis_title="Impact Energy (Megatons) - Log Scale",
+        yaxis_title="Max Affected Population - Log Scale",
+        #xaxis_type="log",
+        #yaxis_type="log",
     )
     st.plotly_chart(fig_wow, use_container_width=True)
     st.markdown("""
@@ -241,35 +267,42 @@ if 'results_df' in st.session_state:
 
     # Display plots
     st.subheader("Distribution of Key Parameters")
-    fig1 = px.histogram(
-        results_df,
-        x="diameter_m",
+    fig1 = histogram_figure(
+        results_df['diameter_m'],
         title="Distribution of Asteroid Diameters",
-        labels={'diameter_m': 'Diameter (m)'}
+        x_label='Diameter (m)',
     )
     st.plotly_chart(fig1, use_container_width=True)
 
     # Use log scale for energy and population as they span orders of magnitude
-    fig2 = px.histogram(
-        results_df,
-        x="impact_energy_mt",
-        #log_x=True,
+    fig2 = histogram_figure(
+        results_df['impact_energy_mt'],
         title="Distribution of Impact Energy",
-        labels={'impact_energy_mt': 'Impact Energy (Megatons)'}
+        x_label='Impact Energy (Megatons)',
     )
     st.plotly_chart(fig2, use_container_width=True)
 
-    fig3 = px.histogram(
-        results_df[results_df['max_affected_population'] > 1],
-        x="max_affected_population",
-        #log_x=True,
+    affected = results_df['max_affected_population']
+    fig3 = histogram_figure(
+        affected[affected > 1],
         title="Distribution of Affected Population",
-        labels={'max_affected_population': 'Maximum Affected Population'}
+        x_label='Maximum Affected Population',
     )
     st.plotly_chart(fig3, use_container_width=True)
 
     st.subheader("Raw Results Data")
-    st.dataframe(results_df)
+    # The table is serialised in full to the browser, so only a preview is sent
+    # Rounding is left to the display, the cached float32 results stay unrounded
+    preview_df = results_df.head(1000)
+    st.dataframe(
+        preview_df,
+        column_config={
+            column: st.column_config.NumberColumn(format="%.2f")
+            for column in preview_df.select_dtypes('number').columns
+        },
+    )
+    if len(results_df) > 1000:
+        st.caption(f"Showing the first 1,000 of {len(results_df):,} cases.")
 
 
 else:
@@ -1,13 +1,9 @@
 import streamlit as st
 from streamlit_folium import st_folium
 import folium
-from global_land_mask import globe
 from pathlib import Path
-import fiona
-import geopandas as gpd
-from shapely.geometry import Point
+import shapely
 import math
-import time
 import numpy as np
 
 # -----------------------------
@@ -20,8 +16,58 @@ st.set_page_config(page_title="Impact Event", layout="wide")
 # Load geo data
 # -----------------------------
 gpkg_path = Path("data/external/ne_10m_urban_areas.gpkg")
-layer = fiona.listlayers(gpkg_path)[0]  # 'ne_10m_urban_areas'
-URBAN = gpd.read_file(gpkg_path, layer=layer).set_crs(4326)
+
+def _cell_index(lat, lon):
+    """Row and column of the 1°×1° global cell holding a point (scalars or arrays)."""
+    row = np.clip(np.floor(90.0 - np.asarray(lat)), 0, 179).astype(np.intp)
+    col = np.clip(np.floor(np.asarray(lon) + 180.0), 0, 359).astype(np.intp)
+    return row, col
+
+
+# Loaded once per process and shared by every session and rerun; a
+# GeoDataFrame can't be pickled for st.cache_data, hence cache_resource.
+# geopandas and pyogrio are only needed here, so they are imported on first
+# load instead of at the top of the page
+@st.cache_resource
+def load_urban(gpkg_path: Path) -> tuple["gpd.GeoDataFrame", shapely.STRtree, np.ndarray]:
+    import geopandas as gpd
+    import pyogrio
+
+    layer = pyogrio.list_layers(gpkg_path)[0][0]  # 'ne_10m_urban_areas'
+    # Only the geometry is used downstream, so skip every attribute column
+    # and let GDAL hand the batch over as Arrow
+    urban = gpd.read_file(gpkg_path, layer=layer, engine="pyogrio", columns=[], use_arrow=True)
+    urban = urban.set_crs(4326, allow_override=True)
+    # ~500 m of vertex detail is below what a click at city zoom can resolve,
+    # and every containment test scales with vertex count. Topology is kept
+    # so towns smaller than the tolerance don't collapse to empty shapes
+    urban["geometry"] = urban.geometry.simplify(0.005, preserve_topology=True)
+    # Queried directly rather than through the GeoDataFrame's lazy sindex
+    # wrapper, and built now rather than on the first click
+    tree = shapely.STRtree(urban.geometry.values)
+    # Prepared in place, once: the point-in-polygon tests then reuse each
+    # polygon's GEOS index instead of walking its edges on every click
+    shapely.prepare(tree.geometries)
+
+    # 1°×1° cells touched by any polygon's bounding box; a click in a clear
+    # cell (open ocean, most of the globe) is rural without a tree query
+    cells = np.zeros((180, 360), dtype=bool)
+    min_lon, min_lat, max_lon, max_lat = shapely.bounds(tree.geometries).T
+    top, left = _cell_index(max_lat, min_lon)
+    bottom, right = _cell_index(min_lat, max_lon)
+    for r0, r1, c0, c1 in zip(top, bottom, left, right):
+        cells[r0:r1 + 1, c0:c1 + 1] = True
+    return urban, tree, cells
+
+URBAN, URBAN_TREE, URBAN_CELLS = load_urban(gpkg_path)
+
+# Every impact image is read once per process; a rerun then only looks the
+# name up instead of touching the disk for each existence check
+@st.cache_resource
+def load_images(image_dir: Path = Path("webapp/images")) -> dict[str, bytes]:
+    return {path.name: path.read_bytes() for path in image_dir.glob("img_*.png")}
+
+IMAGES = load_images()
 
 # -----------------------------
 # Parameters
@@ -43,41 +89,52 @@ effects_data_base = {
 # -----------------------------
 # Helpers
 # -----------------------------
-def safe_is_land(lat, lon):
-    """Safely check if coordinates are on land (no crash)."""
-    try:
-        if not math.isfinite(lat) or not math.isfinite(lon):
-            return False
-        lat = max(min(lat, 90), -90)
-        lon = max(min(lon, 180), -180)
-        return globe.is_land(lat, lon)
-    except Exception:
+# Coastlines stored as Roaring bitmaps refined by the shoreline polygons, so a
+# point lookup no longer needs the full GLOBE grid in memory. Built on the
+# first click and kept for the process
+@st.cache_resource
+def load_landmask():
+    from roaring_landmask import RoaringLandmask
+    return RoaringLandmask.new()
+
+
+def lookup_is_land(lat, lon):
+    """Check if coordinates are on land; raises if the landmask lookup fails."""
+    if not math.isfinite(lat) or not math.isfinite(lon):
         return False
+    lat = max(min(lat, 90), -90)
+    lon = max(min(lon, 180), -180)
+    return bool(load_landmask().contains(lon, lat))  # x, y order
 
 
-def is_coordinates_urban(lat: float, lon: float) -> bool:
-    """Check if coordinates are in an urban area (safe)."""
-    try:
-        pt = Point(lon, lat)
-        cand = URBAN.sindex.query(pt, predicate="intersects")
-        return len(cand) > 0 and URBAN.iloc[list(cand)].intersects(pt).any()
-    except Exception:
+def lookup_is_urban(lat: float, lon: float) -> bool:
+    """Check if coordinates are in an urban area; raises if the lookup fails."""
+    if not URBAN_CELLS[_cell_index(lat, lon)]:
         return False
+    # The tree only narrows to bounding-box candidates; the exact test then
+    # runs on the raw coordinates, without building a Point per candidate
+    candidates = URBAN_TREE.geometries[URBAN_TREE.query(shapely.points(lon, lat))]
+    return bool(shapely.intersects_xy(candidates, lon, lat).any())
 
 
-def draw_effect_circles(
-    m,
-    center_lat,
-    center_lon,
-    effect_key,
-    metric_key,
-    effects_data,
-    severity_max,
-    effect_colors,
-    icon_name="remove-sign",
-):
-    """Draw concentric circles for an effect."""
-    effect_data = effects_data[effect_key]
+EARTH_RADIUS_M = 6371008.8
+_RING_BEARINGS = np.linspace(0.0, 2.0 * np.pi, 65)
+
+
+def _geodesic_ring(lat: float, lon: float, radius_m: float) -> list[list[float]]:
+    """Closed `[lon, lat]` ring `radius_m` metres around a point (spherical Earth)."""
+    phi, lam = math.radians(lat), math.radians(lon)
+    delta = radius_m / EARTH_RADIUS_M
+    ring_phi = np.arcsin(math.sin(phi) * math.cos(delta)
+                         + math.cos(phi) * math.sin(delta) * np.cos(_RING_BEARINGS))
+    ring_lam = lam + np.arctan2(np.sin(_RING_BEARINGS) * math.sin(delta) * math.cos(phi),
+                                math.cos(delta) - math.sin(phi) * np.sin(ring_phi))
+    # Longitudes are left unwrapped so rings crossing the antimeridian stay closed
+    return np.column_stack([np.degrees(ring_lam), np.degrees(ring_phi)]).tolist()
+
+
+def _ring_properties(effect_key, metric_key, effect_data, severity_max, effect_colors) -> tuple:
+    """`(radius, properties)` of each ring drawn for an effect, independent of its center."""
     distances = effect_data["distance"]
     severities = effect_data["severity"]
     vulnerabilities = effect_data["vulnerability"]
@@ -85,6 +142,7 @@ def draw_effect_circles(
     color = effect_colors.get(effect_key, "gray")
     max_sev = severity_max.get(effect_key, 100)
 
+    rings = []
     for d, sev, vul in zip(distances, severities, vulnerabilities):
         if metric_key == "vulnerability":
             opacity = vul
@@ -99,17 +157,78 @@ def draw_effect_circles(
             f"<b>Vulnerability:</b> {vul}"
         )
 
-        folium.Circle(
-            location=[center_lat, center_lon],
-            radius=d,
-            color=color,
-            fill=True,
-            fill_color=color,
-            fill_opacity=opacity,
-            weight=2,
-            popup=f"{effect_key} ({metric_key}) — {value:.2f}",
-            tooltip=tooltip_text,
-        ).add_to(m)
+        rings.append((d, {
+            "style": {"color": color, "weight": 2, "fillColor": color, "fillOpacity": opacity},
+            "popup": f"{effect_key} ({metric_key}) — {value:.2f}",
+            "tooltip": tooltip_text,
+        }))
+    return tuple(rings)
+
+
+@st.cache_data(show_spinner=False)
+def _circle_features(center_lat, center_lon, size_label, effect_key, metric_key) -> dict:
+    """GeoJSON FeatureCollection of the concentric circles drawn for an effect."""
+    return {"type": "FeatureCollection", "features": [
+        {
+            "type": "Feature",
+            "geometry": {"type": "Polygon", "coordinates": [_geodesic_ring(center_lat, center_lon, d)]},
+            "properties": properties,
+        }
+        for d, properties in RINGS[(size_label, effect_key, metric_key)]
+    ]}
+
+
+# Shared across sessions, so a point someone already clicked is answered
+# without a lookup; centers are stored at 1e-6 deg, so click jitter stays in one key.
+# A failed lookup raises through the cache, so only real answers are kept
+@st.cache_data(max_entries=1024, show_spinner=False)
+def _is_land_cached(lat: float, lon: float) -> bool:
+    return lookup_is_land(lat, lon)
+
+
+@st.cache_data(max_entries=1024, show_spinner=False)
+def _is_urban_cached(lat: float, lon: float) -> bool:
+    return lookup_is_urban(lat, lon)
+
+
+def classify_center() -> tuple[bool, bool]:
+    """`(is_land, is_urban)` of the selected center, looked up once per click."""
+    center = st.session_state.center
+    cached = st.session_state.get("center_class")
+    if cached is None or cached[0] != center:
+        lat, lon = center
+        try:
+            is_land = _is_land_cached(lat, lon)
+            # There is no urban area at sea, so ocean clicks skip the urban lookup
+            is_urban = is_land and _is_urban_cached(lat, lon)
+        except Exception:
+            # Safe fallback, kept out of both caches so the next run retries
+            return False, False
+        cached = (center, is_land, is_urban)
+        st.session_state.center_class = cached
+    return cached[1], cached[2]
+
+
+def draw_effect_circles(
+    m,
+    center_lat,
+    center_lon,
+    effect_key,
+    metric_key,
+    size_label,
+    icon_name="remove-sign",
+):
+    """Draw concentric circles for an effect."""
+    # All rings go out as one GeoJSON layer rather than one Leaflet object per
+    # circle; zoom and unrelated widgets rerun with the same inputs and reuse
+    # the cached collection
+    folium.GeoJson(
+        _circle_features(center_lat, center_lon, size_label, effect_key, metric_key),
+        name=effect_key,
+        style_function=lambda feature: feature["properties"]["style"],
+        tooltip=folium.GeoJsonTooltip(fields=["tooltip"], labels=False),
+        popup=folium.GeoJsonPopup(fields=["popup"], labels=False),
+    ).add_to(m)
 
     folium.Marker(
         location=[center_lat, center_lon],
@@ -118,6 +237,24 @@ def draw_effect_circles(
     ).add_to(m)
 
 
+# Built fresh on every run: st_folium renders the Map, which mutates its
+# element tree, so one instance can't be shared between sessions. The costly
+# part, the circles' GeoJSON, is already cached by `_circle_features`
+def build_map(location, zoom, center, effect_key, metric_key, size_label) -> folium.Map:
+    """Base map, with the effect circles drawn when a center is selected."""
+    m = folium.Map(location=location, zoom_start=zoom)
+    if center:
+        draw_effect_circles(
+            m,
+            center[0],
+            center[1],
+            effect_key=effect_key,
+            metric_key=metric_key,
+            size_label=size_label,
+        )
+    return m
+
+
 def scale_effects_by_size(base_effects: dict, size_label: str) -> dict:
     """Return scaled severity/vulnerability arrays based on meteor size."""
     scaled = {}
@@ -143,6 +280,18 @@ def scale_effects_by_size(base_effects: dict, size_label: str) -> dict:
     return scaled
 
 
+# The effect tables are fixed per size, so every ring the sidebar can ask
+# for is built once at import; a click only has to place them
+SIZE_LABELS = ("Small", "Medium", "Big")
+RINGS = {
+    (size_label, effect_key, metric_key): _ring_properties(
+        effect_key, metric_key, effect_data, SEVERITY_MAX, EFFECT_COLORS
+    )
+    for size_label in SIZE_LABELS
+    for effect_key, effect_data in scale_effects_by_size(effects_data_base, size_label).items()
+    for metric_key in ("severity", "vulnerability")
+}
+
 
 
 # -----------------------------
@@ -185,9 +334,6 @@ impact_label = st.sidebar.radio("Impact Type:", list(impact_map.keys()))
 size_choice = size_map[size_label]
 impact_choice = impact_map[impact_label]
 
-# Scale effects depending on size
-effects_data = scale_effects_by_size(effects_data_base, size_label)
-
 # Default map
 lat_default, lon_default = 45.5017, -73.5673
 map_width = 1000
@@ -197,92 +343,86 @@ zoom_start_default = 5
 if "zoom" not in st.session_state:
     st.session_state.zoom = zoom_start_default
 
-initial_location = st.session_state.center or [lat_default, lon_default]
-m = folium.Map(location=initial_location, zoom_start=st.session_state.zoom)
-
-# Draw if user already clicked
-if st.session_state.center:
-    lat, lon = st.session_state.center
-    draw_effect_circles(
-        m,
-        lat,
-        lon,
+# Map, banner and image rerun on their own when the map is clicked or zoomed;
+# the header and sidebar above are left as they are
+@st.fragment
+def impact_view(size_label, size_choice, impact_label, impact_choice):
+    initial_location = st.session_state.center or (lat_default, lon_default)
+    m = build_map(
+        initial_location,
+        st.session_state.zoom,
+        st.session_state.center,
         effect_key=st.session_state.effect_choice,
         metric_key=st.session_state.metric_choice,
-        effects_data=effects_data,
-        severity_max=SEVERITY_MAX,
-        effect_colors=EFFECT_COLORS,
+        size_label=size_label,
     )
 
-    # Safe detection
-    is_land = safe_is_land(lat, lon)
-    is_urban = is_coordinates_urban(lat, lon)
-    label_land_sea = "LAND" if is_land else "SEA"
-    label_area = "URBAN" if is_urban else "RURAL"
-    st.success(f"Impact On/Over:\n- Ground = {label_land_sea}\n- Area = {label_area}")
-
-map_data = st_folium(m, width=map_width, height=map_width * (1 / map_ratio_width_height))
-st.markdown("""📢 Fictious Impacts Circle (placeholder) 📢""")
-
-# Handle zoom + click safely
-if map_data:
-    if map_data.get("zoom"):
-        st.session_state.zoom = map_data["zoom"]
+    if st.session_state.center:
+        # Safe detection
+        is_land, is_urban = classify_center()
+        label_land_sea = "LAND" if is_land else "SEA"
+        label_area = "URBAN" if is_urban else "RURAL"
+        st.success(f"Impact On/Over:\n- Ground = {label_land_sea}\n- Area = {label_area}")
+
+    map_data = st_folium(m, width=map_width, height=map_width * (1 / map_ratio_width_height))
+    st.markdown("""📢 Fictious Impacts Circle (placeholder) 📢""")
+
+    # Handle zoom + click safely
+    if map_data:
+        if map_data.get("zoom"):
+            st.session_state.zoom = map_data["zoom"]
+
+        if map_data.get("last_clicked"):
+            lat = map_data["last_clicked"]["lat"]
+            lon = map_data["last_clicked"]["lng"]
+
+            # Validate
+            if not math.isfinite(lat) or not math.isfinite(lon):
+                st.warning("⚠️ Invalid coordinates clicked — ignoring.", icon="⚠️")
+            else:
+                lat_clamped = max(min(lat, 90), -90)
+                lon_clamped = max(min(lon, 180), -180)
+
+                if lat != lat_clamped or lon != lon_clamped:
+                    # A toast outlives the rerun below, so the script no
+                    # longer has to sleep to keep the message on screen
+                    st.toast(
+                        f"Coordinates adjusted to within valid range:\n"
+                        f"Latitude ∈ [-90°, +90°], Longitude ∈ [-180°, +180°]",
+                        icon="🧭"
+                    )
+
+                # Stored at 1e-6 deg (~11 cm) so sub-metre jitter in the click
+                # payload doesn't count as a new point and trigger a rerun
+                new_center = (round(lat_clamped, 6), round(lon_clamped, 6))
+                if st.session_state.center != new_center:
+                    st.session_state.center = new_center
+                    st.session_state.reset = False
+                    st.rerun(scope="fragment")
+
+    # Display image by type
+    if st.session_state.center:
+        is_land, is_urban = classify_center()
+
+        if not is_land:
+            location_code = "s"
+            label_area = "SEA"
+        elif is_urban:
+            location_code = "u"
+            label_area = "URBAN"
+        else:
+            location_code = "r"
+            label_area = "RURAL"
 
-    if map_data.get("last_clicked"):
-        lat = map_data["last_clicked"]["lat"]
-        lon = map_data["last_clicked"]["lng"]
+        img_name = f"img_{size_choice}_{impact_choice}_{location_code}.png"
+        default_name = "img_impact_default_land.png" if is_land else "img_impact_default_sea.png"
 
-        # Validate
-        if not math.isfinite(lat) or not math.isfinite(lon):
-            st.warning("⚠️ Invalid coordinates clicked — ignoring.", icon="⚠️")
-        else:
-            lat_clamped = max(min(lat, 90), -90)
-            lon_clamped = max(min(lon, 180), -180)
-
-            if lat != lat_clamped or lon != lon_clamped:
-                st.warning(
-                    f"🧭 Coordinates adjusted to within valid range:\n"
-                    f"Latitude ∈ [-90°, +90°], Longitude ∈ [-180°, +180°]",
-                    icon="🧭"
-                )
-                time.sleep(1.5)  # allow message to show
-
-            if st.session_state.center != (lat_clamped, lon_clamped):
-                st.session_state.center = (lat_clamped, lon_clamped)
-                st.session_state.reset = False
-                st.rerun()
-
-# Display image by type
-if st.session_state.center:
-    lat, lon = st.session_state.center
-    is_land = safe_is_land(lat, lon)
-    is_urban = is_coordinates_urban(lat, lon)
-
-    if not is_land:
-        location_code = "s"
-        label_area = "SEA"
-    elif is_urban:
-        location_code = "u"
-        label_area = "URBAN"
-    else:
-        location_code = "r"
-        label_area = "RURAL"
-
-    img_name = f"img_{size_choice}_{impact_choice}_{location_code}.png"
-    img_path = Path("webapp/images") / img_name
-    default_img_land = Path("webapp/images/img_impact_default_land.png")
-    default_img_sea = Path("webapp/images/img_impact_default_sea.png")
-
-    if img_path.exists():
-        st.image(str(img_path), caption=f"{size_label} - {impact_label} - {label_area}")
-    elif is_land:
-        if default_img_land.exists():
-            st.image(str(default_img_land), caption=f"Default image — {size_label} - {impact_label} - {label_area}")  
-        else:
-            st.warning(f"⚠️ No image found: {img_name} or default image.")
-    else:
-        if default_img_sea.exists():
-            st.image(str(default_img_sea), caption=f"Default image — {size_label} - {impact_label} - {label_area}")  
+        if img_name in IMAGES:
+            st.image(IMAGES[img_name], caption=f"{size_label} - {impact_label} - {label_area}")
+        elif default_name in IMAGES:
+            st.image(IMAGES[default_name], caption=f"Default image — {size_label} - {impact_label} - {label_area}")
         else:
             st.warning(f"⚠️ No image found: {img_name} or default image.")
+
+
+impact_view(size_label, size_choice, impact_label, impact_choice)